@@ -8,6 +8,7 @@ frontend dependencies.
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 import os
 import sys
@@ -17,6 +18,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 
 # Import routers
 from app.api.routers import bugsigdb_analysis, system
+from app.api.models.api_models import HealthResponse
+from app.utils.config import ALLOWED_ORIGINS, ALLOWED_ORIGIN_REGEX
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -58,6 +61,7 @@ app = FastAPI(
     This is a standalone backend API. Use the CLI tool or integrate with your own frontend.
     """,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     contact={
         "name": "BioAnalyzer Team",
         "url": "https://github.com/your-repo/bioanalyzer-backend",
@@ -78,11 +82,15 @@ app = FastAPI(
     ]
 )
 
-# Configure CORS - Allow all origins for API usage
+# Configure CORS from ALLOWED_ORIGINS / ALLOWED_ORIGIN_REGEX. A wildcard is served
+# without credentials so the middleware can answer with a static "*" instead of
+# echoing each request's Origin header.
+_allow_all_origins = "*" in ALLOWED_ORIGINS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
+    allow_origins=["*"] if _allow_all_origins else ALLOWED_ORIGINS,
+    allow_origin_regex=ALLOWED_ORIGIN_REGEX,
+    allow_credentials=not _allow_all_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -105,12 +113,11 @@ async def root():
     }
 
 
-# Health check endpoint (duplicate for backward compatibility)
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for backward compatibility."""
-    from app.api.routers.system import health_check as system_health_check
-    return await system_health_check()
+# Health check endpoint (duplicate for backward compatibility); the system
+# handler is registered directly so probes skip an extra wrapper call. The schema
+# is documented via responses rather than response_model, which would re-validate
+# the model_construct-ed reply on every probe.
+app.add_api_route("/health", system.health_check, methods=["GET"], responses={200: {"model": HealthResponse}})
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 """
 Pydantic models for API requests and responses.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, List, Optional, Any
 
+from app.utils.config import MAX_BATCH_PMIDS
+
 
 class Message(BaseModel):
     """WebSocket message model."""
@@ -22,10 +24,8 @@ class AnalysisRequest(BaseModel):
 
 
 class BatchAnalysisRequest(BaseModel):
-    """Request model for batch analysis."""
-    pmids: List[str]
-    page: int = 1
-    page_size: int = 20
+    """Request model for batch analysis; larger PMID lists are rejected with 422."""
+    pmids: List[str] = Field(..., max_length=MAX_BATCH_PMIDS)
 
 
 class EnhancedBatchAnalysisRequest(BaseModel):
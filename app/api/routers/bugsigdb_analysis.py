@@ -4,7 +4,8 @@ Simplified API router focused only on the 6 essential BugSigDB fields.
 from fastapi import APIRouter, HTTPException
 import logging
 
-from app.services.bugsigdb_analyzer import analyze_paper_simple
+from app.services.bugsigdb_analyzer import analyze_paper_simple, analyze_papers_batch
+from app.api.models.api_models import BatchAnalysisRequest
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["BugSigDB Analysis"])
@@ -47,6 +48,36 @@ async def analyze_paper(pmid: str):
         raise HTTPException(status_code=500, detail=f"Analysis error: {str(e)}")
 
 
+@router.post("/analyze/batch")
+async def analyze_batch(request: BatchAnalysisRequest):
+    """
+    Analyze several papers for the 6 essential BugSigDB fields.
+    
+    PubMed metadata for all PMIDs is fetched in as few requests as possible and
+    the per-paper analyses run concurrently. At most MAX_BATCH_PMIDS PMIDs are
+    accepted per request.
+    
+    **Returns:**
+    - One analysis result per PMID (``null`` if the analysis failed)
+    """
+    if not request.pmids:
+        raise HTTPException(status_code=400, detail="No PMIDs provided")
+    
+    try:
+        logger.info(f"Starting batch analysis for {len(request.pmids)} PMIDs")
+        
+        results = await analyze_papers_batch(request.pmids)
+        return {
+            "results": results,
+            "total": len(results),
+            "successful": sum(1 for r in results.values() if r)
+        }
+        
+    except Exception as e:
+        logger.error(f"Error in batch analysis: {e}")
+        raise HTTPException(status_code=500, detail=f"Analysis error: {str(e)}")
+
+
 @router.get("/fields")
 async def get_essential_fields():
     """
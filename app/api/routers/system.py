@@ -2,12 +2,15 @@
 System endpoints for health checks, configuration, and metrics.
 """
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import RedirectResponse
 from typing import Dict, List, Optional, Any
 import logging
+import sys
 import psutil
 import asyncio
+import time
 from datetime import datetime
-import pytz
+from importlib import metadata
 
 from app.utils.config import (
     AVAILABLE_MODELS,
@@ -17,10 +20,12 @@ from app.utils.config import (
     ANALYSIS_TIMEOUT,
     API_TIMEOUT,
     GEMINI_API_KEY,
-    NCBI_API_KEY
+    NCBI_API_KEY,
+    GEMINI_HEALTH_CACHE_TTL
 )
 from app.models.unified_qa import UnifiedQA
 from app.services.data_retrieval import PubMedRetriever
+from app.services.cache_manager import CacheManager
 from app.utils.performance_logger import perf_logger
 from app.api.models.api_models import HealthResponse, ConfigResponse, MetricsResponse
 from app.api.utils.api_utils import get_current_timestamp
@@ -32,15 +37,33 @@ router = APIRouter(prefix="/api/v1", tags=["System"])
 unified_qa = UnifiedQA(use_gemini=True, gemini_api_key=GEMINI_API_KEY)
 pubmed_retriever = PubMedRetriever(api_key=NCBI_API_KEY)
 
+# Shared cache manager for /metrics so scrapes don't re-initialize the database
+try:
+    _cache_manager = CacheManager()
+except Exception as e:
+    logger.warning(f"Cache manager unavailable for metrics: {e}")
+    _cache_manager = None
+
+# Boot time is constant for the lifetime of the process
+_BOOT_TIME = psutil.boot_time()
+
+# Read from package metadata so /version never has to import torch itself
+try:
+    _TORCH_VERSION = metadata.version("torch")
+except metadata.PackageNotFoundError:
+    _TORCH_VERSION = "unavailable"
+
+# Last Gemini probe result, reused for GEMINI_HEALTH_CACHE_TTL seconds
+_GEMINI_HEALTH_CACHE: Dict[str, Any] = {"ts": 0.0, "payload": None}
+
 
 @router.get("/")
 async def root():
     """Redirect to the frontend application."""
-    from fastapi.responses import RedirectResponse
     return RedirectResponse(url="/static/index.html")
 
 
-@router.get("/health")
+@router.get("/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """
     **Health check endpoint to verify the service is running.**
@@ -65,7 +88,9 @@ async def health_check():
         # Overall health status
         overall_health = all(services_status.values())
         
-        return HealthResponse(
+        # System response models are built from server-side values only, so
+        # model_construct skips validation. Never use it on client input.
+        return HealthResponse.model_construct(
             status="healthy" if overall_health else "unhealthy",
             timestamp=current_time,
             version="1.0.0"
@@ -73,7 +98,7 @@ async def health_check():
         
     except Exception as e:
         logger.error(f"Error in health check: {e}")
-        return HealthResponse(
+        return HealthResponse.model_construct(
             status="unhealthy",
             timestamp=get_current_timestamp(),
             version="1.0.0"
@@ -93,7 +118,7 @@ async def get_config():
     timeouts, and other system parameters.
     """
     try:
-        return ConfigResponse(
+        return ConfigResponse.model_construct(
             available_models=AVAILABLE_MODELS,
             default_model=DEFAULT_MODEL,
             frontend_timeout=FRONTEND_TIMEOUT,
@@ -108,21 +133,36 @@ async def get_config():
 
 
 @router.get("/health/gemini")
-async def gemini_health_check():
+async def gemini_health_check(force: bool = False):
     """
     **Specific health check for Gemini API connectivity.**
     
     This endpoint tests the connection to the Gemini API
-    to ensure it's available for analysis requests.
+    to ensure it's available for analysis requests. The result is
+    cached for ``GEMINI_HEALTH_CACHE_TTL`` seconds so frequent probes
+    do not each trigger a model call; pass ``force=true`` to bypass it.
     
     **Response:**
     Returns Gemini API health status and response time.
     """
+    now = time.monotonic()
+    if (not force and _GEMINI_HEALTH_CACHE["payload"] is not None
+            and now - _GEMINI_HEALTH_CACHE["ts"] < GEMINI_HEALTH_CACHE_TTL):
+        return _GEMINI_HEALTH_CACHE["payload"]
+    
+    payload = await _probe_gemini()
+    _GEMINI_HEALTH_CACHE["ts"] = time.monotonic()
+    _GEMINI_HEALTH_CACHE["payload"] = payload
+    return payload
+
+
+async def _probe_gemini() -> Dict[str, Any]:
+    """Send a test question to the Gemini API and report its health."""
     try:
         start_time = datetime.now()
         
         # Test Gemini API with a simple request
-        test_response = await unified_qa.ask_question("Test question for health check")
+        test_response = await unified_qa.ask_question("Test question for health check", use_cache=False)
         
         response_time = (datetime.now() - start_time).total_seconds()
         
@@ -157,8 +197,8 @@ async def gemini_health_check():
 async def ncbi_health_check(pmid: str = "31452104"):
     """Check NCBI E-Utilities connectivity and basic metadata availability."""
     try:
-        retriever = PubMedRetriever(api_key=NCBI_API_KEY)
-        md = retriever.fetch_paper_metadata(pmid)
+        # Bypass the metadata cache so an NCBI outage is actually detected
+        md = await pubmed_retriever.get_paper_metadata_async(pmid, use_cache=False)
         ok = bool(md.get("title") or md.get("abstract"))
         return {
             "status": "healthy" if ok else "unhealthy",
@@ -194,21 +234,17 @@ async def get_metrics():
         
         # Get system resource metrics
         memory_info = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=1)
-        disk_usage = psutil.disk_usage('/')
         
         # Calculate cache hit rate (if available)
         cache_hit_rate = 0.0
         try:
-            from app.services.cache_manager import CacheManager
-            cache_manager = CacheManager()
-            cache_stats = cache_manager.get_cache_stats()
+            cache_stats = _cache_manager.get_cache_stats() if _cache_manager else {}
             if cache_stats.get('total_requests', 0) > 0:
                 cache_hit_rate = cache_stats.get('cache_hits', 0) / cache_stats.get('total_requests', 1)
         except Exception:
             pass
         
-        return MetricsResponse(
+        return MetricsResponse.model_construct(
             total_requests=perf_metrics.get('total_requests', 0),
             successful_requests=perf_metrics.get('successful_requests', 0),
             failed_requests=perf_metrics.get('failed_requests', 0),
@@ -226,6 +262,16 @@ async def get_metrics():
         raise HTTPException(status_code=500, detail=f"Error getting metrics: {str(e)}")
 
 
+def _status_payload(result: Any) -> Dict[str, Any]:
+    """Convert a sub-check result for /status, mapping failures to an unhealthy payload."""
+    if isinstance(result, Exception):
+        logger.error(f"Sub-check failed in system status: {result}")
+        return {"status": "unhealthy", "error": str(result)}
+    if hasattr(result, "dict"):
+        return result.dict()
+    return result
+
+
 @router.get("/status")
 async def get_system_status():
     """
@@ -238,30 +284,31 @@ async def get_system_status():
     Returns detailed system status information.
     """
     try:
-        # Get basic health status
-        health_status = await health_check()
-        
-        # Get configuration
-        config = await get_config()
-        
-        # Get metrics
-        metrics = await get_metrics()
-        
-        # Get Gemini health
-        gemini_health = await gemini_health_check()
-        
         # System uptime (approximate)
-        import time
-        uptime_seconds = time.time() - psutil.boot_time()
+        uptime_seconds = time.time() - _BOOT_TIME
         uptime_hours = uptime_seconds / 3600
         
+        # Run the sub-checks concurrently so latency is bounded by the slowest one
+        health_status, config, metrics, gemini_health = await asyncio.gather(
+            health_check(),
+            get_config(),
+            get_metrics(),
+            gemini_health_check(),
+            return_exceptions=True
+        )
+        
+        if isinstance(health_status, Exception):
+            overall_status = "unhealthy"
+        else:
+            overall_status = health_status.status
+        
         return {
-            "overall_status": health_status.status,
+            "overall_status": overall_status,
             "uptime_hours": round(uptime_hours, 2),
-            "health": health_status.dict(),
-            "config": config.dict(),
-            "metrics": metrics.dict(),
-            "gemini_api": gemini_health,
+            "health": _status_payload(health_status),
+            "config": _status_payload(config),
+            "metrics": _status_payload(metrics),
+            "gemini_api": _status_payload(gemini_health),
             "timestamp": get_current_timestamp()
         }
         
@@ -282,13 +329,10 @@ async def get_version():
     Returns version information.
     """
     try:
-        import sys
-        import torch
-        
         return {
             "application_version": "1.0.0",
             "python_version": sys.version,
-            "torch_version": torch.__version__,
+            "torch_version": _TORCH_VERSION,
             "fastapi_version": "0.104.1",  # Update as needed
             "pydantic_version": "2.5.0",  # Update as needed
             "timestamp": get_current_timestamp()
@@ -2,108 +2,124 @@
 Shared utility functions for API endpoints.
 """
 import re
+import csv
 import logging
+import threading
 from typing import Dict, List, Optional
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# Genus with an optional lowercase species epithet, matched in a single pass
+_TAXA_RE = re.compile(r'\b([A-Z][a-z]+)\b(?: ([a-z]+)\b)?')
+
+# PMID -> metadata index per CSV dump, built lazily on first lookup
+_CSV_INDEX: Dict[str, Dict[str, Dict]] = {}
+_CSV_LOCK = threading.Lock()
+_CSV_METADATA_FIELDS = ('title', 'authors', 'journal', 'publication_date')
+
 
 def extract_taxa(text: str) -> List[str]:
     """Extract potential taxa from text."""
-    # This is a simplified implementation
-    taxa_patterns = [
-        r'\b[A-Z][a-z]+ [a-z]+\b',  # Genus species
-        r'\b[A-Z][a-z]+\b',  # Genus only
-    ]
+    # This is a simplified implementation: every capitalised word is a
+    # candidate genus, and "Genus species" pairs are kept as well.
+    taxa = set()
+    for match in _TAXA_RE.finditer(text):
+        genus, species = match.groups()
+        taxa.add(genus)
+        if species:
+            taxa.add(f"{genus} {species}")
     
-    taxa = []
-    for pattern in taxa_patterns:
-        matches = re.findall(pattern, text)
-        taxa.extend(matches)
-    
-    return list(set(taxa))
+    return list(taxa)
+
+
+# Keys every field analysis entry must carry
+_REQUIRED_FIELD_KEYS = frozenset((
+    "status", "value", "confidence", "reason_if_missing", "suggestions"
+))
+
+# Display names for the 6 essential fields
+_PRETTY_FIELD_NAMES = {
+    "host_species": "Host Species",
+    "body_site": "Body Site",
+    "condition": "Condition",
+    "sequencing_type": "Sequencing Type",
+    "taxa_level": "Taxa Level",
+    "sample_size": "Sample Size"
+}
+
+# Default structures for the 6 essential fields when they are missing
+_DEFAULT_FIELD_STRUCTURES: Dict[str, Dict] = {
+    "host_species": {
+        "status": "ABSENT",
+        "value": None,
+        "confidence": 0.0,
+        "reason_if_missing": "No host species information found in the paper",
+        "suggestions": "Look for mentions of human, mouse, rat, or other study organisms"
+    },
+    "body_site": {
+        "status": "ABSENT", 
+        "value": None,
+        "confidence": 0.0,
+        "reason_if_missing": "No body site information found in the paper",
+        "suggestions": "Look for mentions of gut, oral, skin, or other sampling sites"
+    },
+    "condition": {
+        "status": "ABSENT",
+        "value": None,
+        "confidence": 0.0,
+        "reason_if_missing": "No condition information found in the paper",
+        "suggestions": "Look for disease names, treatments, or exposure conditions"
+    },
+    "sequencing_type": {
+        "status": "ABSENT",
+        "value": None,
+        "confidence": 0.0,
+        "reason_if_missing": "No sequencing type information found in the paper",
+        "suggestions": "Look for mentions of 16S, metagenomics, or other sequencing methods"
+    },
+    "taxa_level": {
+        "status": "ABSENT",
+        "value": None,
+        "confidence": 0.0,
+        "reason_if_missing": "No taxonomic level information found in the paper",
+        "suggestions": "Look for mentions of phylum, genus, species, or other taxonomic levels"
+    },
+    "sample_size": {
+        "status": "ABSENT",
+        "value": None,
+        "confidence": 0.0,
+        "reason_if_missing": "No sample size information found in the paper",
+        "suggestions": "Look for numbers of samples, participants, or study groups"
+    }
+}
 
 
 def create_default_field_structure(field_name: str) -> Dict:
     """Create a default structure for a missing field."""
-    field_structures = {
-        "host_species": {
-            "status": "ABSENT",
-            "value": None,
-            "confidence": 0.0,
-            "reason_if_missing": "No host species information found in the paper",
-            "suggestions": "Look for mentions of human, mouse, rat, or other study organisms"
-        },
-        "body_site": {
-            "status": "ABSENT", 
-            "value": None,
-            "confidence": 0.0,
-            "reason_if_missing": "No body site information found in the paper",
-            "suggestions": "Look for mentions of gut, oral, skin, or other sampling sites"
-        },
-        "condition": {
-            "status": "ABSENT",
-            "value": None,
-            "confidence": 0.0,
-            "reason_if_missing": "No condition information found in the paper",
-            "suggestions": "Look for disease names, treatments, or exposure conditions"
-        },
-        "sequencing_type": {
-            "status": "ABSENT",
-            "value": None,
-            "confidence": 0.0,
-            "reason_if_missing": "No sequencing type information found in the paper",
-            "suggestions": "Look for mentions of 16S, metagenomics, or other sequencing methods"
-        },
-        "taxa_level": {
-            "status": "ABSENT",
-            "value": None,
-            "confidence": 0.0,
-            "reason_if_missing": "No taxonomic level information found in the paper",
-            "suggestions": "Look for mentions of phylum, genus, species, or other taxonomic levels"
-        },
-        "sample_size": {
-            "status": "ABSENT",
-            "value": None,
-            "confidence": 0.0,
-            "reason_if_missing": "No sample size information found in the paper",
-            "suggestions": "Look for numbers of samples, participants, or study groups"
-        }
-    }
+    template = _DEFAULT_FIELD_STRUCTURES.get(field_name)
+    if template is not None:
+        return dict(template)
     
-    return field_structures.get(field_name, {
+    return {
         "status": "ABSENT",
         "value": None,
         "confidence": 0.0,
         "reason_if_missing": f"No {field_name} information found in the paper",
         "suggestions": f"Look for {field_name} related information in the paper"
-    })
+    }
 
 
 def validate_field_structure(field_data: Dict, field_name: str) -> bool:
     """Validate that a field has the correct structure."""
-    required_keys = {
-        "status", "value", "confidence", "reason_if_missing", "suggestions"
-    }
-    
-    if not isinstance(field_data, dict):
-        return False
-    
-    return required_keys.issubset(field_data.keys())
+    return isinstance(field_data, dict) and _REQUIRED_FIELD_KEYS.issubset(field_data)
 
 
 def create_comprehensive_fallback_analysis() -> Dict:
     """Create a comprehensive fallback analysis when parsing completely fails."""
-    return {
-        "host_species": create_default_field_structure("host_species"),
-        "body_site": create_default_field_structure("body_site"),
-        "condition": create_default_field_structure("condition"),
-        "sequencing_type": create_default_field_structure("sequencing_type"),
-        "taxa_level": create_default_field_structure("taxa_level"),
-        "sample_size": create_default_field_structure("sample_size")
-    }
+    return {name: dict(template) for name, template in _DEFAULT_FIELD_STRUCTURES.items()}
 
 
 def generate_curation_summary(parsed_analysis: Dict, missing_fields: List[str]) -> str:
@@ -114,29 +130,57 @@ def generate_curation_summary(parsed_analysis: Dict, missing_fields: List[str])
     summary_parts = [f"Missing fields for curation: {', '.join(missing_fields)}"]
     
     for field in missing_fields:
-        if field in parsed_analysis and "suggestions" in parsed_analysis[field]:
-            suggestion = parsed_analysis[field]["suggestions"]
-            if suggestion:
-                summary_parts.append(f"- {field.replace('_', ' ').title()}: {suggestion}")
+        entry = parsed_analysis.get(field)
+        if not isinstance(entry, dict):
+            continue
+        suggestion = entry.get("suggestions")
+        if suggestion:
+            pretty_name = _PRETTY_FIELD_NAMES.get(field) or field.replace('_', ' ').title()
+            summary_parts.append(f"- {pretty_name}: {suggestion}")
     
     return " ".join(summary_parts)
 
 
+def _load_csv_index(csv_path: str) -> Dict[str, Dict]:
+    """Read the CSV dump once and index its metadata rows by PMID."""
+    index: Dict[str, Dict] = {}
+    with open(csv_path, newline='', encoding='utf-8') as csvfile:
+        # Plain csv.reader with column indices avoids a dict per row
+        reader = csv.reader(csvfile)
+        columns = {name: i for i, name in enumerate(next(reader, []))}
+        pmid_idx = columns.get('pmid')
+        if pmid_idx is None:
+            logger.warning(f"No 'pmid' column found in {csv_path}")
+            return index
+        
+        field_idx = [(name, columns.get(name)) for name in _CSV_METADATA_FIELDS]
+        for row in reader:
+            if len(row) <= pmid_idx:
+                continue
+            pmid = row[pmid_idx]
+            if pmid and pmid not in index:
+                index[pmid] = {
+                    name: row[i] if i is not None and i < len(row) else ''
+                    for name, i in field_idx
+                }
+    logger.info(f"Indexed {len(index)} papers from {csv_path}")
+    return index
+
+
 def get_paper_metadata_from_csv(pmid: str, csv_path: str = 'data/full_dump.csv') -> Optional[Dict]:
-    """Get paper metadata from CSV file."""
+    """Get paper metadata from CSV file (indexed on first use)."""
     try:
-        import csv
-        with open(csv_path, newline='', encoding='utf-8') as csvfile:
-            # Skip comment lines (starting with #) or skip first 2 lines
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                if row.get('pmid') == pmid:
-                    return {
-                        'title': row.get('title', ''),
-                        'authors': row.get('authors', ''),
-                        'journal': row.get('journal', ''),
-                        'publication_date': row.get('publication_date', '')
-                    }
+        index = _CSV_INDEX.get(csv_path)
+        if index is None:
+            with _CSV_LOCK:
+                index = _CSV_INDEX.get(csv_path)
+                if index is None:
+                    index = _load_csv_index(csv_path)
+                    _CSV_INDEX[csv_path] = index
+        
+        metadata = index.get(pmid)
+        if metadata is not None:
+            return dict(metadata)
     except Exception as e:
         logger.error(f"Error reading CSV metadata for PMID {pmid}: {e}")
     
@@ -145,4 +189,4 @@ def get_paper_metadata_from_csv(pmid: str, csv_path: str = 'data/full_dump.csv')
 
 def get_current_timestamp() -> str:
     """Get current timestamp in ISO format."""
-    return datetime.now(pytz.UTC).isoformat()
+    return datetime.now(_UTC).isoformat()
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Optional, Dict
 
 # ===============================
@@ -91,7 +91,8 @@ class ServiceConfig:
     log_level: str = "INFO"
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Flat dataclass of scalars: a shallow copy matches asdict() without its recursion
+        return self.__dict__.copy()
 
 
 # ===============================
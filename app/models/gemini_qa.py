@@ -1,17 +1,341 @@
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 import os
 import json
-from app.utils.config import GEMINI_TIMEOUT
+import re
+import copy
+import hashlib
+import random
+from collections import OrderedDict
+from types import MappingProxyType
+from app.utils.config import GEMINI_TIMEOUT, GEMINI_CONCURRENCY, GEMINI_BREAKER_THRESHOLD, GEMINI_BREAKER_RESET, GEMINI_RETRY_ATTEMPTS, GEMINI_ACQUIRE_TIMEOUT, GEMINI_RPS, GEMINI_BURST, MAX_CACHE_SIZE, CACHE_VALIDITY_HOURS, DEBUG_LIST_MODELS, FAST_PREFILTER, GEMINI_TRANSPORT, MAX_FULL_TEXT_TOKENS
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.utils.rate_limiter import AsyncTokenBucket
+from app.models.prompts import CURATION_PROMPT, ENHANCED_PROMPT_TEMPLATE, CHAT_PREAMBLE
 import asyncio
 import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+try:
+    import tiktoken
+    _ENC = tiktoken.get_encoding("cl100k_base")
+except Exception:  # optional; fall back to a character estimate
+    _ENC = None
 
 logger = logging.getLogger(__name__)
 
+_LISTED_MODELS: Optional[List[str]] = None
+# (api_key, transport) the SDK was last configured with; genai.configure drops its cached clients
+_CONFIGURED: Optional[Tuple[str, Optional[str]]] = None
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _loads_embedded(text: str, opener: str):
+    """
+    Decode the first JSON value starting at `opener` in model output, ignoring any
+    surrounding prose before or after it.
+    """
+    return _JSON_DECODER.raw_decode(text, max(text.find(opener), 0))[0]
+
+# (log label, user-facing detail) for known failure classes, checked by SDK exception type first
+_QUOTA_ERROR = ("Model API quota exceeded", "Model API quota exceeded. Please check your API usage limits.")
+_ACCESS_ERROR = ("Model API access denied", "Model API access denied. Check API key permissions and IP restrictions.")
+_AUTH_ERROR = ("Model API authentication failed", "Model API authentication failed. Check your API key.")
+_NETWORK_ERROR = ("Network connectivity issue", "Network connectivity issue. Check your internet connection.")
+_TIMEOUT_ERROR = ("Model API timeout", "Model API request timed out. The service may be slow or unavailable.")
+_EXC_TYPE_MAP = {
+    google_exceptions.ResourceExhausted: _QUOTA_ERROR,
+    google_exceptions.PermissionDenied: _ACCESS_ERROR,
+    google_exceptions.Unauthenticated: _AUTH_ERROR,
+    google_exceptions.ServiceUnavailable: _NETWORK_ERROR,
+    google_exceptions.DeadlineExceeded: _TIMEOUT_ERROR,
+}
+# ...then by message keywords, in priority order
+_ERROR_PATTERNS = (
+    (("quota",), _QUOTA_ERROR),
+    (("permission", "access"), _ACCESS_ERROR),
+    (("authentication", "invalid"), _AUTH_ERROR),
+    (("network", "connection"), _NETWORK_ERROR),
+    (("timeout",), _TIMEOUT_ERROR),
+)
+
+# Default structure for each BugSigDB field in the enhanced analysis JSON (read-only; copy before use)
+_REQUIRED_FIELD_DEFAULTS = MappingProxyType({
+    "host_species": MappingProxyType({"primary": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for host species information"}),
+    "body_site": MappingProxyType({"site": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for body site information"}),
+    "condition": MappingProxyType({"description": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for condition information"}),
+    "sequencing_type": MappingProxyType({"method": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for sequencing method information"}),
+    "taxa_level": MappingProxyType({"level": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for taxonomic level information"}),
+    "sample_size": MappingProxyType({"size": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for sample size information"})
+})
+
+# Field structures reported when the enhanced analysis could not be parsed
+_FALLBACK_FIELDS = MappingProxyType({
+    "host_species": MappingProxyType({"primary": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"}),
+    "body_site": MappingProxyType({"site": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"}),
+    "condition": MappingProxyType({"description": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"}),
+    "sequencing_type": MappingProxyType({"method": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"}),
+    "taxa_level": MappingProxyType({"level": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"}),
+    "sample_size": MappingProxyType({"size": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"})
+})
+
+# Per-field key holding the extracted value in enhanced-analysis JSON
+_CONTENT_KEYS = MappingProxyType({
+    "host_species": "primary",
+    "body_site": "site",
+    "condition": "description",
+    "sequencing_type": "method",
+    "taxa_level": "level",
+    "sample_size": "size"
+})
+
+class BulkheadFull(Exception):
+    """Raised when no Gemini slot frees up within GEMINI_ACQUIRE_TIMEOUT; the call never started."""
+
+
+# Transient failures worth retrying; BulkheadFull is excluded so saturation fails fast; each attempt also counts toward the circuit breaker
+_RETRYABLE_ERRORS = (asyncio.TimeoutError, google_exceptions.ServiceUnavailable)
+_RETRY_BACKOFF_BASE = 0.5  # seconds
+_RETRY_BACKOFF_CAP = 4.0  # seconds
+
+# Characters that are unsafe or awkward in result filenames
+_FS_TR = str.maketrans({c: "_" for c in ' /\\:?*"<>|\t\n'})
+
+_CONF_RE = re.compile(r'(\d+\.?\d*)')
+
+# Section headers emitted by the analyze_paper prompt, matched in one scan per line
+_SECTION_HEADERS = {
+    "CURATION READINESS ASSESSMENT:": "readiness",
+    "DETAILED EXPLANATION:": "explanation",
+    "FACTOR-BASED ANALYSIS:": "factor_analysis",
+    "MICROBIAL SIGNATURE ANALYSIS:": "signatures",
+    "CURATABLE CONTENT ASSESSMENT:": "content",
+    "SPECIFIC REASONS": "reasons",
+    "CONFIDENCE LEVEL:": "confidence",
+    "EXAMPLES AND EVIDENCE:": "examples",
+}
+_SECTION_RE = re.compile("|".join(re.escape(h) for h in _SECTION_HEADERS))
+
+# Shared by category scoring, found-term extraction and the prefilter; immutable so safe to share
+_CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "microbiome": ("microbiome", "microbial", "bacteria", "microbiota"),
+    "methods": ("16s", "metagenomic", "sequencing", "amplicon", "shotgun", "transcriptomic", "qpcr", "fish"),
+    "analysis": ("enriched", "depleted", "increased", "decreased", "differential", "higher abundance", "lower abundance"),
+    "body_sites": ("gut", "oral", "skin", "lung", "vaginal", "intestinal", "colon", "mouth", "dermal", "epidermis", "airway", "bronchial", "cervical"),
+    "diseases": ("ibd", "cancer", "tumor", "carcinoma", "neoplasm", "obesity", "diabetes", "infection", "autoimmune", "arthritis", "lupus", "multiple sclerosis")
+}
+# Zero-width lookahead so overlapping hits are reported, keeping plain substring semantics
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kws in _CATEGORY_KEYWORDS.values() for kw in kws) + "))"
+)
+
+
+def _find_keywords(text: str) -> set:
+    """Return every category keyword that occurs in text, in a single scan."""
+    return set(_KEYWORD_RE.findall(text))
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure the SDK once per key so every GeminiQA shares its pooled client connections."""
+    global _CONFIGURED
+    options = (api_key, GEMINI_TRANSPORT)
+    if _CONFIGURED == options:
+        return
+    if GEMINI_TRANSPORT:
+        genai.configure(api_key=api_key, transport=GEMINI_TRANSPORT)
+    else:
+        genai.configure(api_key=api_key)
+    _CONFIGURED = options
+
+
+@lru_cache(maxsize=32)
+def _chat_config(max_output_tokens: int) -> "genai.types.GenerationConfig":
+    """Chat generation settings for one output budget, built once and shared by every call using it."""
+    return genai.types.GenerationConfig(
+        temperature=0.3,
+        max_output_tokens=max_output_tokens,
+        top_p=0.9,
+        top_k=40
+    )
+
+
+def _truncate_tokens(text: str, budget: int) -> str:
+    """Cut text to roughly `budget` tokens (tiktoken when installed, else ~4 chars per token)."""
+    if _ENC is None:
+        return text[:budget * 4]
+    tokens = _ENC.encode(text)
+    return _ENC.decode(tokens[:budget]) if len(tokens) > budget else text
+
+
+def _empty_curation() -> Dict:
+    """Fresh parse_enhanced_analysis result with default values (new lists on every call)."""
+    return {
+        "readiness": "UNKNOWN",
+        "explanation": "",
+        "microbial_signatures": "Unknown",
+        "signature_types": [],
+        "data_quality": "Unknown",
+        "statistical_significance": "Unknown",
+        "required_fields": [],
+        "missing_fields": [],
+        "data_completeness": "Unknown",
+        "specific_reasons": [],
+        "confidence": 0.0,
+        "examples": [],
+        "general_factors_present": [],
+        "human_animal_factors_present": [],
+        "environmental_factors_present": [],
+        "missing_critical_factors": [],
+        "factor_based_score": 0.0
+    }
+
+
+def _after_colon(line: str) -> str:
+    _, sep, rest = line.partition(":")
+    return rest.strip() if sep else ""
+
+
+def _factor_based_score(analysis: Dict) -> float:
+    total_factors = len(analysis["general_factors_present"]) + \
+                   len(analysis["human_animal_factors_present"]) + \
+                   len(analysis["environmental_factors_present"])
+    max_factors = 16
+    return min(1.0, total_factors / max_factors)
+
+
+def _parse_readiness(line: str, analysis: Dict) -> None:
+    line_upper = line.upper()
+    if "READY FOR CURATION" in line_upper:
+        analysis["readiness"] = "READY"
+    elif "NOT READY FOR CURATION" in line_upper:
+        analysis["readiness"] = "NOT_READY"
+    elif "READY" in line_upper and "NOT" not in line_upper:
+        analysis["readiness"] = "READY"
+    elif "NOT READY" in line_upper:
+        analysis["readiness"] = "NOT_READY"
+    elif "UNKNOWN" in line_upper or "UNCLEAR" in line_upper:
+        analysis["readiness"] = "UNKNOWN"
+
+
+def _parse_factor_analysis(line: str, analysis: Dict) -> None:
+    if "General Factors Present:" in line:
+        analysis["general_factors_present"] = [f.strip() for f in _after_colon(line).split(",") if f.strip()]
+    elif "Human/Animal Factors Present:" in line:
+        analysis["human_animal_factors_present"] = [f.strip() for f in _after_colon(line).split(",") if f.strip()]
+    elif "Environmental Factors Present:" in line:
+        analysis["environmental_factors_present"] = [f.strip() for f in _after_colon(line).split(",") if f.strip()]
+    elif "Missing Critical Factors:" in line:
+        analysis["missing_critical_factors"] = [f.strip() for f in _after_colon(line).split(",") if f.strip()]
+
+
+def _parse_signatures(line: str, analysis: Dict) -> None:
+    line_low = line.lower()
+    if "Presence of microbial signatures:" in line:
+        if "yes" in line_low:
+            analysis["microbial_signatures"] = "Present"
+        elif "no" in line_low:
+            analysis["microbial_signatures"] = "Absent"
+        elif "partial" in line_low:
+            analysis["microbial_signatures"] = "Partial"
+    elif "Types of signatures found:" in line:
+        analysis["signature_types"] = [t.strip() for t in _after_colon(line).split(",") if t.strip()]
+    elif "Quality of signature data:" in line:
+        if "high" in line_low:
+            analysis["data_quality"] = "High"
+        elif "medium" in line_low:
+            analysis["data_quality"] = "Medium"
+        elif "low" in line_low:
+            analysis["data_quality"] = "Low"
+    elif "Statistical significance:" in line:
+        if "yes" in line_low:
+            analysis["statistical_significance"] = "Yes"
+        elif "no" in line_low:
+            analysis["statistical_significance"] = "No"
+        elif "insufficient" in line_low:
+            analysis["statistical_significance"] = "Insufficient"
+
+
+def _parse_content(line: str, analysis: Dict) -> None:
+    if "Missing required fields:" in line:
+        analysis["missing_fields"] = [f.strip() for f in _after_colon(line).split(",") if f.strip()]
+    elif "Data completeness:" in line:
+        line_low = line.lower()
+        if "complete" in line_low:
+            analysis["data_completeness"] = "Complete"
+        elif "partial" in line_low:
+            analysis["data_completeness"] = "Partial"
+        elif "insufficient" in line_low:
+            analysis["data_completeness"] = "Insufficient"
+
+
+def _parse_reasons(line: str, analysis: Dict) -> None:
+    if line.startswith("-") or line.startswith("*"):
+        analysis["specific_reasons"].append(line.lstrip("- *").strip())
+
+
+def _parse_confidence(line: str, analysis: Dict) -> None:
+    confidence_match = _CONF_RE.search(line)
+    if confidence_match:
+        analysis["confidence"] = float(confidence_match.group(1))
+
+
+def _parse_examples(line: str, analysis: Dict) -> None:
+    if line.startswith("-") or line.startswith("*"):
+        analysis["examples"].append(line.lstrip("- *").strip())
+
+
+# Per-section line handlers for parse_enhanced_analysis ("explanation" is collected inline)
+_SECTION_HANDLERS = {
+    "readiness": _parse_readiness,
+    "factor_analysis": _parse_factor_analysis,
+    "signatures": _parse_signatures,
+    "content": _parse_content,
+    "reasons": _parse_reasons,
+    "confidence": _parse_confidence,
+    "examples": _parse_examples,
+}
+
+
+def _is_outage_error(exc: BaseException) -> bool:
+    """Errors that indicate Gemini is unavailable or overloaded (vs. a bad request)."""
+    return isinstance(exc, (
+        asyncio.TimeoutError,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServerError,
+        ConnectionError,
+    ))
+
+
+def _classify_error(exc: Exception, error_msg: str) -> Optional[Tuple[str, str]]:
+    classified = _EXC_TYPE_MAP.get(type(exc))
+    if classified:
+        return classified
+    low = error_msg.lower()
+    return next((entry for keywords, entry in _ERROR_PATTERNS if any(kw in low for kw in keywords)), None)
+
+
+def _write_text(path: Path, text: str) -> None:
+    with open(path, 'w') as f:
+        f.write(text)
+
+
+def _category_scores(found: set) -> Dict[str, float]:
+    return {
+        cat: min(1.0, sum(1 for kw in keywords if kw in found) / max(1, len(keywords)))
+        for cat, keywords in _CATEGORY_KEYWORDS.items()
+    }
+
+
+def _found_terms(found: set) -> Dict[str, List[str]]:
+    return {cat: [kw for kw in keywords if kw in found] for cat, keywords in _CATEGORY_KEYWORDS.items()}
+
+
 class GeminiQA:
     """Enhanced QA system using an external model API for biomedical paper analysis."""
 
@@ -23,14 +347,80 @@ class GeminiQA:
         self.results_dir.mkdir(parents=True, exist_ok=True)
         if not self.api_key:
             logger.warning("No model API key provided. Set GEMINI_API_KEY in your environment.")
-        genai.configure(api_key=self.api_key)
+        _configure_genai(self.api_key)
+        # Bulkhead: bounds in-flight API calls across all callers of this instance
+        self._sem = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        # Paces calls below the API quota so bursts wait locally instead of coming back as 429s
+        self._bucket = AsyncTokenBucket(GEMINI_RPS, max(GEMINI_BURST, 1)) if GEMINI_RPS > 0 else None
+        # Fails fast during Gemini outages instead of waiting out GEMINI_TIMEOUT per request
+        self._breaker = CircuitBreaker(
+            "gemini",
+            fail_threshold=GEMINI_BREAKER_THRESHOLD,
+            reset_timeout=GEMINI_BREAKER_RESET,
+            is_failure=_is_outage_error
+        )
+        # Exact-match cache of successful responses as (stored_at, result), keyed on model + input hash
+        self._response_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._cache_ttl = CACHE_VALIDITY_HOURS * 3600
         
-        # Debug: List available Gemini models
-        try:
-            available_models = [m.name for m in genai.list_models() if 'gemini' in m.name.lower()]
-            logger.info(f"Available Gemini models: {available_models}")
-        except Exception as e:
-            logger.warning(f"Could not list models: {e}")
+        # Model handle and request settings are reused across calls (analysis and chat)
+        self._gmodel = genai.GenerativeModel(self.model)
+        self._gen_config_short = genai.types.GenerationConfig(
+            temperature=0.1,
+            max_output_tokens=500,
+            top_p=0.8,
+            top_k=20
+        )
+        self._gen_config_enhanced = genai.types.GenerationConfig(
+            temperature=0.1,
+            max_output_tokens=500,
+            top_p=0.7,
+            top_k=10
+        )
+        self._gen_config_chat = _chat_config(300)
+        self._safety = [
+            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"},
+            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_ONLY_HIGH"},
+            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_ONLY_HIGH"},
+            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_ONLY_HIGH"}
+        ]
+        
+        # Debug: List available Gemini models (network call, so opt-in and once per process)
+        if DEBUG_LIST_MODELS:
+            global _LISTED_MODELS
+            if _LISTED_MODELS is None:
+                try:
+                    _LISTED_MODELS = [m.name for m in genai.list_models() if 'gemini' in m.name.lower()]
+                    logger.info(f"Available Gemini models: {_LISTED_MODELS}")
+                except Exception as e:
+                    logger.warning(f"Could not list models: {e}")
+
+    def _cache_key(self, kind: str, content: str) -> str:
+        return hashlib.sha256(f"{self.model}|v1|{kind}|{content}".encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] > self._cache_ttl:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return copy.deepcopy(entry[1])
+
+    def _cache_put(self, key: str, result: Dict) -> None:
+        self._response_cache[key] = (time.monotonic(), copy.deepcopy(result))
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > MAX_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached model responses."""
+        self._response_cache.clear()
+
+    @property
+    def cache_size(self) -> int:
+        return len(self._response_cache)
 
     def estimate_confidence(self, key_findings):
         if not key_findings:
@@ -38,19 +428,7 @@ class GeminiQA:
         return min(1.0, 0.3 + 0.15 * len(key_findings))
 
     def estimate_category_scores(self, key_findings):
-        categories = {
-            "microbiome": ["microbiome", "microbial", "bacteria", "microbiota"],
-            "methods": ["16s", "metagenomic", "sequencing", "amplicon", "shotgun", "transcriptomic", "qpcr", "fish"],
-            "analysis": ["enriched", "depleted", "increased", "decreased", "differential", "higher abundance", "lower abundance"],
-            "body_sites": ["gut", "oral", "skin", "lung", "vaginal", "intestinal", "colon", "mouth", "dermal", "epidermis", "airway", "bronchial", "cervical"],
-            "diseases": ["ibd", "cancer", "tumor", "carcinoma", "neoplasm", "obesity", "diabetes", "infection", "autoimmune", "arthritis", "lupus", "multiple sclerosis"]
-        }
-        text = " ".join(key_findings).lower()
-        scores = {}
-        for cat, keywords in categories.items():
-            count = sum(1 for kw in keywords if kw in text)
-            scores[cat] = min(1.0, count / max(1, len(keywords)))
-        return scores
+        return _category_scores(_find_keywords(" ".join(key_findings).lower()))
 
     def parse_gemini_output(self, key_findings):
         findings = []
@@ -72,314 +450,106 @@ class GeminiQA:
         return findings, suggested_topics
 
     def extract_found_terms(self, key_findings):
-        categories = {
-            "microbiome": ["microbiome", "microbial", "bacteria", "microbiota"],
-            "methods": ["16s", "metagenomic", "sequencing", "amplicon", "shotgun", "transcriptomic", "qpcr", "fish"],
-            "analysis": ["enriched", "depleted", "increased", "decreased", "differential", "higher abundance", "lower abundance"],
-            "body_sites": ["gut", "oral", "skin", "lung", "vaginal", "intestinal", "colon", "mouth", "dermal", "epidermis", "airway", "bronchial", "cervical"],
-            "diseases": ["ibd", "cancer", "tumor", "carcinoma", "neoplasm", "obesity", "diabetes", "infection", "autoimmune", "arthritis", "lupus", "multiple sclerosis"]
-        }
-        text = " ".join(key_findings).lower()
-        found = {}
-        for cat, keywords in categories.items():
-            found[cat] = [kw for kw in keywords if kw in text]
-        return found
+        return _found_terms(_find_keywords(" ".join(key_findings).lower()))
+
+    def _postprocess(self, analysis_text: str):
+        """Derive findings, suggested topics, confidence and keyword scores in one pass over the lines."""
+        lines = []
+        findings = []
+        suggested_topics = []
+        in_suggested = False
+        for line in analysis_text.split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+            lines.append(line)
+            if 'Suggested Topics' in line:
+                in_suggested = True
+                continue
+            if in_suggested:
+                if line.startswith(('*', '-')):
+                    suggested_topics.append(line.strip('*- ').strip())
+                    continue
+                in_suggested = False
+            findings.append(line)
+
+        found = _find_keywords(" ".join(lines).lower())
+        return findings, suggested_topics, self.estimate_confidence(lines), _category_scores(found), _found_terms(found)
 
     def parse_enhanced_analysis(self, analysis_text: str) -> Dict[str, Union[str, float, List[str]]]:
         try:
-            lines = analysis_text.split('\n')
-            curation_analysis = {
-                "readiness": "UNKNOWN",
-                "explanation": "",
-                "microbial_signatures": "Unknown",
-                "signature_types": [],
-                "data_quality": "Unknown",
-                "statistical_significance": "Unknown",
-                "required_fields": [],
-                "missing_fields": [],
-                "data_completeness": "Unknown",
-                "specific_reasons": [],
-                "confidence": 0.0,
-                "examples": [],
-                "general_factors_present": [],
-                "human_animal_factors_present": [],
-                "environmental_factors_present": [],
-                "missing_critical_factors": [],
-                "factor_based_score": 0.0
-            }
+            curation_analysis = _empty_curation()
             
             current_section = ""
-            for line in lines:
+            explanation_parts: List[str] = []
+            for line in analysis_text.splitlines():
                 line = line.strip()
                 if not line:
                     continue
                     
-                if "CURATION READINESS ASSESSMENT:" in line:
-                    current_section = "readiness"
-                    continue
-                elif "DETAILED EXPLANATION:" in line:
-                    current_section = "explanation"
-                    continue
-                elif "FACTOR-BASED ANALYSIS:" in line:
-                    current_section = "factor_analysis"
-                    continue
-                elif "MICROBIAL SIGNATURE ANALYSIS:" in line:
-                    current_section = "signatures"
-                    continue
-                elif "CURATABLE CONTENT ASSESSMENT:" in line:
-                    current_section = "content"
-                    continue
-                elif "SPECIFIC REASONS" in line:
-                    current_section = "reasons"
-                    continue
-                elif "CONFIDENCE LEVEL:" in line:
-                    current_section = "confidence"
-                    continue
-                elif "EXAMPLES AND EVIDENCE:" in line:
-                    current_section = "examples"
+                header = _SECTION_RE.search(line)
+                if header:
+                    current_section = _SECTION_HEADERS[header.group(0)]
                     continue
                 
-                if current_section == "readiness":
-                    line_upper = line.upper()
-                    if "READY FOR CURATION" in line_upper:
-                        curation_analysis["readiness"] = "READY"
-                    elif "NOT READY FOR CURATION" in line_upper:
-                        curation_analysis["readiness"] = "NOT_READY"
-                    elif "READY" in line_upper and "NOT" not in line_upper:
-                        curation_analysis["readiness"] = "READY"
-                    elif "NOT READY" in line_upper:
-                        curation_analysis["readiness"] = "NOT_READY"
-                    elif "UNKNOWN" in line_upper or "UNCLEAR" in line_upper:
-                        curation_analysis["readiness"] = "UNKNOWN"
-                elif current_section == "explanation":
-                    curation_analysis["explanation"] += line + " "
-                elif current_section == "factor_analysis":
-                    if "General Factors Present:" in line:
-                        factors_text = line.split(":", 1)[1] if ":" in line else ""
-                        curation_analysis["general_factors_present"] = [f.strip() for f in factors_text.split(",") if f.strip()]
-                    elif "Human/Animal Factors Present:" in line:
-                        factors_text = line.split(":", 1)[1] if ":" in line else ""
-                        curation_analysis["human_animal_factors_present"] = [f.strip() for f in factors_text.split(",") if f.strip()]
-                    elif "Environmental Factors Present:" in line:
-                        factors_text = line.split(":", 1)[1] if ":" in line else ""
-                        curation_analysis["environmental_factors_present"] = [f.strip() for f in factors_text.split(",") if f.strip()]
-                    elif "Missing Critical Factors:" in line:
-                        factors_text = line.split(":", 1)[1] if ":" in line else ""
-                        curation_analysis["missing_critical_factors"] = [f.strip() for f in factors_text.split(",") if f.strip()]
-                elif current_section == "signatures":
-                    if "Presence of microbial signatures:" in line:
-                        if "yes" in line.lower():
-                            curation_analysis["microbial_signatures"] = "Present"
-                        elif "no" in line.lower():
-                            curation_analysis["microbial_signatures"] = "Absent"
-                        elif "partial" in line.lower():
-                            curation_analysis["microbial_signatures"] = "Partial"
-                    elif "Types of signatures found:" in line:
-                        types_text = line.split(":", 1)[1] if ":" in line else ""
-                        curation_analysis["signature_types"] = [t.strip() for t in types_text.split(",") if t.strip()]
-                    elif "Quality of signature data:" in line:
-                        if "high" in line.lower():
-                            curation_analysis["data_quality"] = "High"
-                        elif "medium" in line.lower():
-                            curation_analysis["data_quality"] = "Medium"
-                        elif "low" in line.lower():
-                            curation_analysis["data_quality"] = "Low"
-                    elif "Statistical significance:" in line:
-                        if "yes" in line.lower():
-                            curation_analysis["statistical_significance"] = "Yes"
-                        elif "no" in line.lower():
-                            curation_analysis["statistical_significance"] = "No"
-                        elif "insufficient" in line.lower():
-                            curation_analysis["statistical_significance"] = "Insufficient"
-                elif current_section == "content":
-                    if "Missing required fields:" in line:
-                        fields_text = line.split(":", 1)[1] if ":" in line else ""
-                        curation_analysis["missing_fields"] = [f.strip() for f in fields_text.split(",") if f.strip()]
-                    elif "Data completeness:" in line:
-                        if "complete" in line.lower():
-                            curation_analysis["data_completeness"] = "Complete"
-                        elif "partial" in line.lower():
-                            curation_analysis["data_completeness"] = "Partial"
-                        elif "insufficient" in line.lower():
-                            curation_analysis["data_completeness"] = "Insufficient"
-                elif current_section == "reasons":
-                    if line.startswith("-") or line.startswith("*"):
-                        curation_analysis["specific_reasons"].append(line.lstrip("- *").strip())
-                elif current_section == "confidence":
-                    import re
-                    confidence_match = re.search(r'(\d+\.?\d*)', line)
-                    if confidence_match:
-                        curation_analysis["confidence"] = float(confidence_match.group(1))
-                elif current_section == "examples":
-                    if line.startswith("-") or line.startswith("*"):
-                        curation_analysis["examples"].append(line.lstrip("- *").strip())
+                if current_section == "explanation":
+                    explanation_parts.append(line)
+                else:
+                    handler = _SECTION_HANDLERS.get(current_section)
+                    if handler:
+                        handler(line, curation_analysis)
             
-            curation_analysis["explanation"] = curation_analysis["explanation"].strip()
-            total_factors = len(curation_analysis["general_factors_present"]) + \
-                           len(curation_analysis["human_animal_factors_present"]) + \
-                           len(curation_analysis["environmental_factors_present"])
-            max_factors = 16
-            curation_analysis["factor_based_score"] = min(1.0, total_factors / max_factors)
+            curation_analysis["explanation"] = " ".join(explanation_parts)
+            curation_analysis["factor_based_score"] = _factor_based_score(curation_analysis)
             
             return curation_analysis
             
         except Exception as e:
             logger.error(f"Error parsing enhanced analysis: {str(e)}")
-            return {
-                "readiness": "ERROR",
-                "explanation": f"Error parsing analysis: {str(e)}",
-                "microbial_signatures": "Unknown",
-                "signature_types": [],
-                "data_quality": "Unknown",
-                "statistical_significance": "Unknown",
-                "required_fields": [],
-                "missing_fields": [],
-                "data_completeness": "Unknown",
-                "specific_reasons": [],
-                "confidence": 0.0,
-                "examples": [],
-                "general_factors_present": [],
-                "human_animal_factors_present": [],
-                "environmental_factors_present": [],
-                "missing_critical_factors": [],
-                "factor_based_score": 0.0
-            }
+            curation_analysis = _empty_curation()
+            curation_analysis["readiness"] = "ERROR"
+            curation_analysis["explanation"] = f"Error parsing analysis: {str(e)}"
+            return curation_analysis
 
     async def analyze_paper(self, paper_content: Dict[str, str]) -> Dict[str, Union[str, float, Dict[str, float]]]:
+        if FAST_PREFILTER:
+            probe = f"{paper_content.get('title', '')} {paper_content.get('abstract', '')}".lower()
+            if not _KEYWORD_RE.search(probe):
+                logger.info("Prefilter: no microbiome terms in title/abstract, skipping model call")
+                return self._prefiltered_result()
+
         try:
             content = f"Title: {paper_content.get('title', '')}\n"
             content += f"Abstract: {paper_content.get('abstract', '')}\n"
             if paper_content.get('full_text'):
-                content += f"Full Text: {paper_content['full_text']}\n"
-
-            prompt = """You are an expert scientific curator specializing in microbial signature analysis. Your task is to analyze this paper and provide a comprehensive assessment of its curation readiness based on the methods and experimental design.
-
-## COMPREHENSIVE CURATION READINESS CRITERIA
-
-### GENERAL FACTORS (Applicable to ALL Study Types)
-A paper is READY FOR CURATION if it contains ALL of the following fundamental factors:
-1. Specific Microbial Taxa Identification
-2. Differential Abundance/Compositional Changes
-3. Proper Experimental Design
-4. Microbiota Characterization Methodology
-5. Quantitative Data/Statistical Significance
-6. Data Availability/Repository Information
-
-### METHODS-SPECIFIC ASSESSMENT CRITERIA
-7. Sequencing and Molecular Methods
-8. Statistical and Analytical Methods
-9. Sample Collection and Processing
-10. Experimental Design Quality
-
-### SPECIFIC FACTORS FOR HUMAN/ANIMAL STUDIES
-11. Host Health Outcome/Phenotype Associations
-12. Host/Study Population Characteristics
-13. Intervention/Exposure Details (if applicable)
-14. Sample Type from Host
-15. Proposed Molecular Mechanisms/Pathways
-
-### SPECIFIC FACTORS FOR ENVIRONMENTAL STUDIES
-16. Environmental Context/Associated Factors
-17. Sample Type from Environment
-18. Geospatial Data (Highly Valued)
-19. Study Duration/Seasonality
-20. Associated Chemical/Physical Measurements
-
-### ENVIRONMENTAL STUDIES CRITERIA (Simplified Check)
-A paper is READY FOR CURATION if it contains ANY of the following:
-1. Indoor environment microbiome studies with human health implications
-2. Built environment studies (hospitals, schools, transportation, public spaces)
-3. Agricultural/food safety studies with microbial analysis
-4. Industrial environment studies with health implications
-5. Environmental studies with clear microbial signatures and health relevance
-
-### NOT READY FOR CURATION Criteria
-A paper is NOT READY FOR CURATION only if:
-- It's purely a review article with no original research
-- It contains NO microbial data or sequencing results
-- It only mentions "microbiome" in passing without specific findings
-- It lacks any quantitative or qualitative microbial data
-- It's purely ecological without health implications
-- It contains no quantitative microbial analysis
-
-Please provide a detailed analysis in the following structured format:
-
-**CURATION READINESS ASSESSMENT:**
-[Start with a clear statement: "READY FOR CURATION" or "NOT READY FOR CURATION"]
-
-**DETAILED EXPLANATION:**
-[Provide a comprehensive explanation of why the paper is or isn't ready for curation]
-
-**FACTOR-BASED ANALYSIS:**
-- General Factors Present: [List which of the 6 general factors are present]
-- Human/Animal Factors Present: [List which of the 5 human/animal factors are present, if applicable]
-- Environmental Factors Present: [List which of the 5 environmental factors are present, if applicable]
-- Missing Critical Factors: [List any missing factors that prevent curation readiness]
-
-**MICROBIAL SIGNATURE ANALYSIS:**
-- Presence of microbial signatures: [Yes/No/Partial]
-- Types of signatures found: [List specific types like "differential abundance", "community composition"]
-- Quality of signature data: [High/Medium/Low]
-- Statistical significance: [Yes/No/Insufficient]
-
-**CURATABLE CONTENT ASSESSMENT:**
-- Missing required fields: [List what's missing, if any]
-
-**SPECIFIC REASONS FOR READINESS/NON-READINESS:**
-[If NOT READY, explain exactly what's missing]
-[If READY, explain what makes it suitable]
-
-**KEY FINDINGS:**
-[List the main scientific findings related to microbial signatures]
-
-**SUGGESTED TOPICS FOR FUTURE RESEARCH:**
-[List potential follow-up studies]
-
-**CONFIDENCE LEVEL:**
-[Provide a confidence score (0.0-1.0) with explanation]
-
-**EXAMPLES AND EVIDENCE:**
-[Provide specific examples from the text]
-
-CRITICAL: If the paper contains ANY specific microbial taxa identification, abundance data, or microbial community analysis, it should be marked as READY FOR CURATION."""
-
-            model = genai.GenerativeModel(self.model)
-            response = await model.generate_content_async(
-                f"{prompt}\n\nAnalyze this paper:\n{content}",
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.1,
-                    max_output_tokens=500,
-                    top_p=0.8,
-                    top_k=20
-                ),
-                safety_settings=[
-                    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"},
-                    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_ONLY_HIGH"},
-                    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_ONLY_HIGH"},
-                    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_ONLY_HIGH"}
-                ]
-            )
+                content += f"Full Text: {_truncate_tokens(paper_content['full_text'], MAX_FULL_TEXT_TOKENS)}\n"
+
+            cache_key = self._cache_key("paper", content)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached paper analysis")
+                return cached
+
+            async with self._slot():
+                response = await asyncio.wait_for(
+                    self._gmodel.generate_content_async(
+                        f"{CURATION_PROMPT}\n\nAnalyze this paper:\n{content}",
+                        generation_config=self._gen_config_short,
+                        safety_settings=self._safety
+                    ),
+                    timeout=GEMINI_TIMEOUT
+                )
             analysis_text = response.text.strip()
 
-            if self.results_dir:
-                timestamp = datetime.now(pytz.UTC).strftime("%Y%m%d_%H%M%S")
-                paper_title = paper_content.get('title', 'unknown').replace(' ', '_')
-                filename = self.results_dir / f"model_analysis_{timestamp}_{paper_title[:50]}.txt"
-                with open(filename, 'w') as f:
-                    f.write(analysis_text)
-                logger.info(f"Analysis saved to {filename}")
+            await self._save_analysis(paper_content.get('title', 'unknown'), analysis_text)
 
             logger.info(f"Raw model response for debugging:\n{analysis_text}")
             curation_analysis = self.parse_enhanced_analysis(analysis_text)
             logger.info(f"Parsed curation analysis: {curation_analysis}")
             
-            key_findings_raw = [line.strip() for line in analysis_text.split('\n') if line.strip()]
-            confidence = self.estimate_confidence(key_findings_raw)
-            category_scores = self.estimate_category_scores(key_findings_raw)
-            findings, suggested_topics = self.parse_gemini_output(key_findings_raw)
-            found_terms = self.extract_found_terms(key_findings_raw)
+            findings, suggested_topics, confidence, category_scores, found_terms = self._postprocess(analysis_text)
 
-            return {
+            result = {
                 "key_findings": findings,
                 "confidence": confidence,
                 "status": "success",
@@ -390,6 +560,8 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                 "curation_analysis": curation_analysis,
                 "raw_analysis": analysis_text
             }
+            self._cache_put(cache_key, result)
+            return result
         except asyncio.TimeoutError:
             logger.error("Paper analysis request timed out")
             return {
@@ -430,6 +602,84 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                 }
             }
 
+    async def _save_analysis(self, title: str, analysis_text: str) -> None:
+        if not self.results_dir:
+            return
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        paper_title = title.translate(_FS_TR)[:50]
+        filename = self.results_dir / f"model_analysis_{timestamp}_{paper_title}.txt"
+        await asyncio.to_thread(_write_text, filename, analysis_text)
+        logger.info(f"Analysis saved to {filename}")
+
+    def _prefiltered_result(self) -> Dict:
+        explanation = "No microbiome or sequencing keywords found in title or abstract"
+        return {
+            "key_findings": [],
+            "confidence": 0.0,
+            "status": "success",
+            "suggested_topics": [],
+            "found_terms": _found_terms(set()),
+            "category_scores": _category_scores(set()),
+            "num_tokens": 0,
+            "curation_analysis": {
+                "readiness": "NOT_READY",
+                "explanation": explanation,
+                "microbial_signatures": "Absent",
+                "missing_fields": [],
+                "confidence": 0.8
+            },
+            "raw_analysis": ""
+        }
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Bulkhead around a Gemini call; raises BulkheadFull if no slot frees up in time."""
+        if self._bucket is not None:
+            await self._bucket.acquire()
+        try:
+            await asyncio.wait_for(self._sem.acquire(), timeout=GEMINI_ACQUIRE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise BulkheadFull(f"No Gemini slot free within {GEMINI_ACQUIRE_TIMEOUT}s") from None
+        try:
+            yield
+        finally:
+            self._sem.release()
+
+    async def _call_model(self, *args, timeout: float = GEMINI_TIMEOUT, **kwargs):
+        """One guarded API call: bulkhead slot, circuit breaker and a per-call timeout."""
+        async with self._slot(), self._breaker:
+            return await asyncio.wait_for(
+                self._gmodel.generate_content_async(*args, **kwargs),
+                timeout=timeout
+            )
+
+    async def _call_model_with_retry(self, *args, budget: Optional[float] = None, **kwargs):
+        """
+        _call_model with jittered exponential backoff on transient failures.
+
+        budget is the caller's deadline in seconds. It is split evenly across attempts, but never
+        below GEMINI_TIMEOUT each, so long generations (e.g. multi-paper batches) are not cut off
+        at the default. Attempts end by the deadline, and a retry is skipped when less than
+        GEMINI_TIMEOUT would be left for it.
+        """
+        deadline = None
+        attempt_timeout = GEMINI_TIMEOUT
+        if budget is not None:
+            deadline = time.monotonic() + budget
+            attempt_timeout = max(GEMINI_TIMEOUT, budget / GEMINI_RETRY_ATTEMPTS)
+        for attempt in range(GEMINI_RETRY_ATTEMPTS):
+            timeout = attempt_timeout if deadline is None else min(attempt_timeout, deadline - time.monotonic())
+            try:
+                return await self._call_model(*args, timeout=timeout, **kwargs)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == GEMINI_RETRY_ATTEMPTS - 1:
+                    raise
+                delay = random.uniform(0, min(_RETRY_BACKOFF_CAP, _RETRY_BACKOFF_BASE * 2 ** attempt))
+                if deadline is not None and deadline - time.monotonic() - delay < GEMINI_TIMEOUT:
+                    raise
+                logger.warning(f"Model API call failed ({type(e).__name__}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
     async def analyze_paper_enhanced(self, prompt: str) -> Dict[str, Union[str, float, List[str]]]:
         try:
             if not self.api_key:
@@ -443,100 +693,24 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                     "debug_info": {
                         "issue": "Missing API key",
                         "solution": "Set GEMINI_API_KEY environment variable",
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": datetime.now(timezone.utc).isoformat()
                     }
                 }
             
-            model = genai.GenerativeModel(self.model)
-            
-            enhanced_structured_prompt = f"""
-            You are a specialized AI assistant for BugSigDB curation with expertise in microbial signature analysis. Your task is to analyze scientific papers and extract specific information in a structured JSON format with high accuracy.
-
-            {prompt}
-
-            CRITICAL EXTRACTION GUIDELINES FOR ACCURACY:
-
-            1. HOST SPECIES EXTRACTION:
-               - Look for explicit mentions: "Human participants", "Mouse model", "Rat study", "Environmental samples"
-               - Check study population descriptions, methods section, and abstract
-               - For environmental studies, identify: "Built environment", "Indoor air", "Soil samples", "Water samples"
-               - Be specific: "Human" not "mammal", "Mouse" not "rodent"
-               - If "Human participants" or "Human subjects" found, mark PRESENT with confidence 0.9
-
-            2. BODY SITE EXTRACTION:
-               - Human/Animal: Look for "fecal", "oral swab", "skin sample", "vaginal swab", "nasal swab"
-               - Environmental: Look for "indoor surface", "restroom", "hospital room", "classroom", "office"
-               - Check sample collection methods and study location descriptions
-               - Be precise: "Gut" not "digestive system", "Indoor air" not "air"
-               - If "fecal samples" or "stool samples" found, mark PRESENT with confidence 0.9
-
-            3. CONDITION EXTRACTION:
-               - Look for disease names: "IBD", "Obesity", "Diabetes", "Cancer"
-               - Check experimental conditions: "Antibiotic treatment", "Diet intervention", "Seasonal changes"
-               - Identify comparative studies: "Men vs women", "Healthy vs diseased", "Before vs after"
-               - Be specific: "Type 2 Diabetes" not "diabetes", "Crohn's disease" not "IBD"
-               - If disease names or experimental conditions found, mark PRESENT with confidence 0.9
-
-            4. SEQUENCING TYPE EXTRACTION:
-               - Look for specific methods: "16S rRNA gene sequencing", "V4 region amplification"
-               - Check for platforms: "Illumina MiSeq", "Next-generation sequencing"
-               - Identify techniques: "Shotgun metagenomics", "Amplicon sequencing"
-               - Be precise: "16S rRNA" not "sequencing", "Metagenomics" not "genomics"
-               - If "16S" or "sequencing" found, mark PRESENT with confidence 0.9
-
-            5. TAXA LEVEL EXTRACTION:
-               - Look for taxonomic classifications: "Phylum Proteobacteria", "Genus Bacteroides"
-               - Check for specific names: "E. coli", "B. fragilis", "Lactobacillus spp."
-               - Identify analysis levels: "Phylum level", "Genus level", "Species level"
-               - Be specific: "Bacteroides fragilis" not "Bacteroides", "Proteobacteria phylum" not "bacteria"
-               - If taxonomic names or levels found, mark PRESENT with confidence 0.9
-
-            6. SAMPLE SIZE EXTRACTION:
-               - Look for numbers: "n=50 participants", "100 samples", "Three time points"
-               - Check study design: "Multiple floors sampled", "Longitudinal study with 6 visits"
-               - Identify sample counts: "48 fecal samples", "24 oral swabs"
-               - Be precise: "n=50" not "multiple samples", "100 samples" not "large sample size"
-               - If numbers or sample counts found, mark PRESENT with confidence 0.9
-
-            CONFIDENCE SCORING GUIDELINES:
-            - PRESENT (0.8-1.0): Information is explicitly stated and clear
-            - PARTIALLY_PRESENT (0.4-0.7): Information is implied or partially described
-            - ABSENT (0.0): Information is completely missing or unclear
-
-            JSON RESPONSE REQUIREMENTS:
-            - Return ONLY valid JSON without any explanatory text
-            - Ensure all field names match exactly: "host_species", "body_site", "condition", "sequencing_type", "taxa_level", "sample_size"
-            - Each field must have: "primary"/"site"/"description"/"method"/"level"/"size", "confidence", "status", "reason_if_missing", "suggestions_for_curation"
-            - Use proper JSON syntax with double quotes for strings
-            - Include all required sub-fields for each main field
-
-            CRITICAL INSTRUCTIONS:
-            1. READ THE TEXT THOROUGHLY - Do not skim. Read every section carefully.
-            2. LOOK FOR EXPLICIT MENTIONS - If the text says "Human participants", that's PRESENT with 0.9 confidence.
-            3. CHECK MULTIPLE SECTIONS - Title, abstract, methods, results, discussion.
-            4. USE CONTEXT CLUES - If it mentions "fecal samples from patients", that's host "Human" and body site "Gut" with 0.9 confidence.
-            5. BE CONFIDENT - If you find clear information, use high confidence (0.8-1.0).
-            6. DON'T GUESS - Only mark as ABSENT if you're absolutely certain the information is missing.
-            7. EXTRACT ACTUAL INFORMATION - Don't infer or guess. Look for what's explicitly stated.
-
-            IMPORTANT: You must respond with ONLY valid JSON. Do not include any explanatory text before or after the JSON. The response should be parseable by json.loads().
-            """
+            cache_key = self._cache_key("enhanced", prompt)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached enhanced analysis")
+                return cached
+
+            enhanced_structured_prompt = ENHANCED_PROMPT_TEMPLATE.format(prompt=prompt)
 
             logger.info(f"Starting model API call with {GEMINI_TIMEOUT}s timeout...")
             start_time = time.time()
             
-            loop = asyncio.get_event_loop()
-            response = await asyncio.wait_for(
-                loop.run_in_executor(None, lambda: model.generate_content(
-                    enhanced_structured_prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.1,
-                        max_output_tokens=500,
-                        top_p=0.7,
-                        top_k=10
-                    )
-                )),
-                timeout=GEMINI_TIMEOUT
+            response = await self._call_model_with_retry(
+                enhanced_structured_prompt,
+                generation_config=self._gen_config_enhanced
             )
             
             elapsed_time = time.time() - start_time
@@ -550,24 +724,19 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                 }
             
             response_text = response.text.strip()
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            
-            if json_start >= 0 and json_end > json_start:
-                json_text = response_text[json_start:json_end]
-            else:
-                json_text = response_text
             
             try:
-                parsed_json = json.loads(json_text)
+                parsed_json = _loads_embedded(response_text, '{')
                 validated_json = self._validate_and_normalize_json(parsed_json)
                 confidence = self._calculate_enhanced_confidence(validated_json)
                 
-                return {
+                result = {
                     "key_findings": json.dumps(validated_json, indent=2),
                     "confidence": confidence,
                     "status": "success"
                 }
+                self._cache_put(cache_key, result)
+                return result
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse JSON response: {e}")
                 logger.warning(f"Raw response: {response_text[:500]}...")
@@ -579,6 +748,24 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                     "status": "fallback",
                     "error": f"JSON parsing failed: {str(e)}"
                 }
+        except CircuitOpenError:
+            logger.warning("Model API circuit open, skipping enhanced analysis call")
+            return {
+                "error": "Model API temporarily unavailable. Please retry shortly.",
+                "error_type": "CircuitOpen",
+                "key_findings": json.dumps(self._create_fallback_json(), indent=2),
+                "confidence": 0.0,
+                "status": "error"
+            }
+        except BulkheadFull:
+            logger.warning("Model API saturated, rejecting enhanced analysis call")
+            return {
+                "error": "Model API busy. Please retry shortly.",
+                "error_type": "BulkheadFull",
+                "key_findings": json.dumps(self._create_fallback_json(), indent=2),
+                "confidence": 0.0,
+                "status": "error"
+            }
         except asyncio.TimeoutError:
             logger.error("Enhanced paper analysis request timed out")
             return {
@@ -589,28 +776,17 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                 "status": "error",
                 "debug_info": {
                     "issue": "Timeout during API call",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now(timezone.utc).isoformat()
                 }
             }
         except Exception as e:
             error_msg = str(e)
             error_type = type(e).__name__
             
-            if "quota" in error_msg.lower() or "quota exceeded" in error_msg.lower():
-                error_detail = "Model API quota exceeded. Please check your API usage limits."
-                logger.error(f"Model API quota exceeded: {error_msg}")
-            elif "permission" in error_msg.lower() or "access" in error_msg.lower():
-                error_detail = "Model API access denied. Check API key permissions and IP restrictions."
-                logger.error(f"Model API access denied: {error_msg}")
-            elif "authentication" in error_msg.lower() or "invalid" in error_msg.lower():
-                error_detail = "Model API authentication failed. Check your API key."
-                logger.error(f"Model API authentication failed: {error_msg}")
-            elif "network" in error_msg.lower() or "connection" in error_msg.lower():
-                error_detail = "Network connectivity issue. Check your internet connection."
-                logger.error(f"Network connectivity issue: {error_msg}")
-            elif "timeout" in error_msg.lower():
-                error_detail = "Model API request timed out. The service may be slow or unavailable."
-                logger.error(f"Model API timeout: {error_msg}")
+            classified = _classify_error(e, error_msg)
+            if classified:
+                label, error_detail = classified
+                logger.error(f"{label}: {error_msg}")
             else:
                 error_detail = f"Unexpected error: {error_msg}"
                 logger.error(f"Unexpected error in Model API: {error_msg}")
@@ -628,36 +804,21 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
                 "debug_info": {
                     "original_error": error_msg,
                     "error_type": error_type,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": datetime.now(timezone.utc).isoformat()
                 }
             }
 
     def _validate_and_normalize_json(self, parsed_json: Dict) -> Dict:
-        required_fields = {
-            "host_species": {"primary": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for host species information"},
-            "body_site": {"site": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for body site information"},
-            "condition": {"description": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for condition information"},
-            "sequencing_type": {"method": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for sequencing method information"},
-            "taxa_level": {"level": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for taxonomic level information"},
-            "sample_size": {"size": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Field not found in analysis", "suggestions_for_curation": "Review paper for sample size information"}
-        }
-        
-        for field_name, default_structure in required_fields.items():
-            if field_name not in parsed_json:
-                parsed_json[field_name] = default_structure.copy()
+        missing_fields = []
+        for field_name, default_structure in _REQUIRED_FIELD_DEFAULTS.items():
+            field_data = parsed_json.get(field_name)
+            if not isinstance(field_data, dict):
+                field_data = parsed_json[field_name] = dict(default_structure)
             else:
-                field_data = parsed_json[field_name]
-                if not isinstance(field_data, dict):
-                    parsed_json[field_name] = default_structure.copy()
-                else:
-                    for key, default_value in default_structure.items():
-                        if key not in field_data:
-                            field_data[key] = default_value
-        
-        missing_fields = [
-            field for field in required_fields.keys()
-            if parsed_json.get(field, {}).get("status") != "PRESENT"
-        ]
+                for key, default_value in default_structure.items():
+                    field_data.setdefault(key, default_value)
+            if field_data.get("status") != "PRESENT":
+                missing_fields.append(field_name)
         
         parsed_json["missing_fields"] = missing_fields
         parsed_json["curation_preparation_summary"] = self._generate_curation_summary(parsed_json, missing_fields)
@@ -665,58 +826,43 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
         return parsed_json
 
     def _create_fallback_json(self) -> Dict:
-        return {
-            "host_species": {"primary": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"},
-            "body_site": {"site": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"},
-            "condition": {"description": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"},
-            "sequencing_type": {"method": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"},
-            "taxa_level": {"level": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"},
-            "sample_size": {"size": "Unknown", "confidence": 0.0, "status": "ABSENT", "reason_if_missing": "Analysis failed - re-run required", "suggestions_for_curation": "Re-run analysis with corrected prompt"},
-            "missing_fields": ["host_species", "body_site", "condition", "sequencing_type", "taxa_level", "sample_size"],
-            "curation_preparation_summary": "Analysis failed - re-run required"
-        }
+        fallback = {field_name: dict(structure) for field_name, structure in _FALLBACK_FIELDS.items()}
+        fallback["missing_fields"] = list(_FALLBACK_FIELDS)
+        fallback["curation_preparation_summary"] = "Analysis failed - re-run required"
+        return fallback
 
     def _calculate_enhanced_confidence(self, validated_json: Dict) -> float:
         try:
-            confidence_scores = []
+            # Single pass: score each field and apply the high-confidence boost as we go
+            total = 0.0
+            count = 0
             for field_name, field_data in validated_json.items():
-                if field_name in ["missing_fields", "curation_preparation_summary"]:
+                if field_name in ("missing_fields", "curation_preparation_summary"):
                     continue
                 if not isinstance(field_data, dict):
                     continue
                 status = field_data.get("status", "ABSENT")
-                field_confidence = field_data.get("confidence", 0.0)
                 if status == "PRESENT":
-                    content_key = self._get_content_key_for_field(field_name)
-                    content_value = field_data.get(content_key, "")
-                    if content_value and content_value.lower() not in ["unknown", "not specified", ""]:
-                        confidence_scores.append(min(1.0, field_confidence + 0.1))
-                    else:
-                        confidence_scores.append(field_confidence)
+                    score = field_data.get("confidence", 0.0)
+                    content_value = field_data.get(_CONTENT_KEYS.get(field_name, "value"), "")
+                    if content_value and content_value.lower() not in ("unknown", "not specified", ""):
+                        score = min(1.0, score + 0.1)
                 elif status == "PARTIALLY_PRESENT":
-                    confidence_scores.append(field_confidence)
+                    score = field_data.get("confidence", 0.0)
                 else:
-                    confidence_scores.append(0.0)
+                    score = 0.0
+                total += score * 1.2 if score >= 0.8 else score
+                count += 1
             
-            if not confidence_scores:
+            if not count:
                 return 0.0
-            weighted_scores = [score * 1.2 if score >= 0.8 else score for score in confidence_scores]
-            final_confidence = sum(weighted_scores) / len(weighted_scores)
-            return min(1.0, final_confidence)
+            return min(1.0, total / count)
         except Exception as e:
             logger.warning(f"Error calculating enhanced confidence: {str(e)}")
             return 0.5
 
     def _get_content_key_for_field(self, field_name: str) -> str:
-        content_keys = {
-            "host_species": "primary",
-            "body_site": "site",
-            "condition": "description",
-            "sequencing_type": "method",
-            "taxa_level": "level",
-            "sample_size": "size"
-        }
-        return content_keys.get(field_name, "value")
+        return _CONTENT_KEYS.get(field_name, "value")
 
     def _generate_curation_summary(self, parsed_json: Dict, missing_fields: List[str]) -> str:
         if not missing_fields:
@@ -728,30 +874,31 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
         else:
             return f"Missing {len(missing_fields)} fields: {', '.join(missing_fields)}. Paper requires significant review before curation."
 
-    async def chat(self, prompt: str) -> dict:
+    async def chat(self, prompt: str, max_output_tokens: Optional[int] = None, use_cache: bool = False,
+                   timeout: Optional[float] = None) -> dict:
+        """
+        Conversational reply; max_output_tokens overrides the short chat default for structured answers.
+
+        Replies are only cached when use_cache is set, which callers should reserve for
+        deterministic extraction prompts; conversation and health probes always hit the API.
+        timeout is the caller's overall deadline in seconds, so retries never outlive it.
+        """
+        generation_config = self._gen_config_chat
+        kind = "chat"
+        if max_output_tokens is not None:
+            generation_config = _chat_config(max_output_tokens)
+            kind = f"chat:{max_output_tokens}"
+        cache_key = self._cache_key(kind, prompt)
+        if use_cache:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         try:
-            chat_prompt = (
-                "You are a helpful scientific assistant. Answer the user's question or message conversationally. "
-                "If the user provides a paper context, use it to inform your answer."
-            )
-            model = genai.GenerativeModel(self.model)
-            response = await asyncio.wait_for(
-                model.generate_content_async(
-                    f"{chat_prompt}\nUser: {prompt}",
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=0.3,
-                        max_output_tokens=300,
-                        top_p=0.9,
-                        top_k=40
-                    ),
-                    safety_settings=[
-                        {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_ONLY_HIGH"},
-                        {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_ONLY_HIGH"},
-                        {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_ONLY_HIGH"},
-                        {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_ONLY_HIGH"}
-                    ]
-                ),
-                timeout=GEMINI_TIMEOUT
+            response = await self._call_model_with_retry(
+                f"{CHAT_PREAMBLE}\nUser: {prompt}",
+                generation_config=generation_config,
+                safety_settings=self._safety,
+                budget=timeout
             )
             # Handle safety filter responses
             if response.candidates and response.candidates[0].finish_reason == 2:
@@ -763,13 +910,23 @@ CRITICAL: If the paper contains ANY specific microbial taxa identification, abun
             
             reply = response.text.strip() if response.text else "No response generated"
             confidence = 1.0 if reply else 0.0
-            return {
+            result = {
                 "text": reply,
                 "confidence": confidence
             }
+            if use_cache and response.text:
+                self._cache_put(cache_key, result)
+            return result
+        except CircuitOpenError:
+            logger.warning("Model API circuit open, skipping chat call")
+            return {"text": "[Error: Model API temporarily unavailable. Please retry shortly.]", "confidence": 0.0}
+        except BulkheadFull:
+            logger.warning("Model API saturated, rejecting chat call")
+            return {"text": "[Error: Model API busy. Please retry shortly.]", "confidence": 0.0}
         except asyncio.TimeoutError:
-            logger.error(f"Chat request timed out after {GEMINI_TIMEOUT} seconds")
-            return {"text": f"[Error: Request timed out after {GEMINI_TIMEOUT} seconds]", "confidence": 0.0}
+            limit = GEMINI_TIMEOUT if timeout is None else timeout
+            logger.error(f"Chat request timed out after {limit} seconds")
+            return {"text": f"[Error: Request timed out after {limit} seconds]", "confidence": 0.0}
         except Exception as e:
             logger.error(f"Model API error in chat: {str(e)}")
             return {
@@ -46,31 +46,42 @@ class UnifiedQA:
                 "Chat functionality will be limited."
             )
 
-    async def chat(self, prompt: str) -> dict:
+    @property
+    def ready(self) -> bool:
+        """True when calls will reach the model; check before building large prompts."""
+        return self.use_gemini and self.qa_system is not None
+
+    async def chat(self, prompt: str, max_output_tokens: Optional[int] = None, use_cache: bool = False,
+                   timeout: Optional[float] = None) -> dict:
         """
         Chat with the QA system (generic conversational).
         Returns a dict with 'text' and 'confidence' keys to match downstream expectations.
         """
-        if not self.qa_system:
+        if not self.ready:
             return {"text": "Model not available. Check GEMINI_API_KEY.", "confidence": 0.0}
         try:
-            return await self.qa_system.chat(prompt)
+            return await self.qa_system.chat(prompt, max_output_tokens=max_output_tokens, use_cache=use_cache,
+                                             timeout=timeout)
         except Exception as e:
             logger.error(f"UnifiedQA.chat error: {e}")
             return {"text": f"Error: {e}", "confidence": 0.0}
 
-    async def ask_question(self, question: str, context: Optional[str] = None, pmid: Optional[str] = None) -> Dict:
+    async def ask_question(self, question: str, context: Optional[str] = None, pmid: Optional[str] = None,
+                           use_cache: bool = False) -> Dict:
         """
         Adapter used by paper_analysis.py and other routers.
         Ensures a common response shape: {'answer': str, 'confidence': float}
         """
+        if not self.ready:
+            return {"answer": "", "confidence": 0.0, "error": "QA system not available", "pmid": pmid}
+
         prompt = question
         if context:
             prompt = f"Context: {context[:2000]}\n\nQuestion: {question}"
 
         # Use chat() under the hood; normalized output
         try:
-            resp = await self.chat(prompt)
+            resp = await self.chat(prompt, use_cache=use_cache)
             text = resp.get("text") or resp.get("answer") or ""
             confidence = float(resp.get("confidence", 0.0) or 0.0)
             return {"answer": text, "confidence": confidence, "pmid": pmid}
@@ -90,7 +101,7 @@ class UnifiedQA:
 
     async def analyze_paper_enhanced(self, prompt: str) -> Dict[str, Union[str, float, List[str]]]:
         """Enhanced analysis method for BugSigDB curation requirements."""
-        if self.use_gemini and self.qa_system:
+        if self.ready:
             return await self.qa_system.analyze_paper_enhanced(prompt)
         else:
             return {
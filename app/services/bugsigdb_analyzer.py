@@ -2,14 +2,15 @@
 Simplified analysis service focused only on the 6 essential BugSigDB fields.
 """
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
-import json
 
 from app.models.unified_qa import UnifiedQA
 from app.services.data_retrieval import PubMedRetriever
-from app.utils.config import DEFAULT_MODEL, GEMINI_API_KEY, NCBI_API_KEY, ANALYSIS_TIMEOUT
+from app.utils.config import DEFAULT_MODEL, GEMINI_API_KEY, NCBI_API_KEY, ANALYSIS_TIMEOUT, USE_FULLTEXT, GEMINI_CONCURRENCY, FIELD_BATCH_SIZE, FIELD_BATCH_WAIT, MAX_CONCURRENT_REQUESTS
 from app.api.utils.api_utils import get_current_timestamp
+from app.utils.async_batcher import AsyncBatcher
+from app.utils.llm_json import parse_llm_json
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +18,10 @@ logger = logging.getLogger(__name__)
 unified_qa = UnifiedQA(use_gemini=True, gemini_api_key=GEMINI_API_KEY)
 pubmed_retriever = PubMedRetriever(api_key=NCBI_API_KEY)
 
+# Queue field calls here so batch analyses don't hit the model bulkhead's acquire timeout;
+# these calls still hold a slot of unified_qa's own bulkhead, so this adds no extra capacity
+_field_sem = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
 # The 6 essential BugSigDB fields
 ESSENTIAL_FIELDS = {
     "host_species": "What host species is being studied in this research?",
@@ -37,6 +42,69 @@ async def analyze_paper_simple(pmid: str) -> Optional[Dict]:
         
         # Get paper metadata
         texts = await pubmed_retriever.get_texts_for_analysis_async(pmid)
+        return await analyze_texts(pmid, texts)
+        
+    except Exception as e:
+        logger.error(f"Error in simple analysis for PMID {pmid}: {e}")
+        return None
+
+
+async def analyze_papers_batch(pmids: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Analyze several papers, fetching all PubMed metadata with one EFetch call.
+
+    The per-paper LLM analysis is then run concurrently.
+    """
+    # Same normalization as fetch_paper_metadata_batch so metadata lookups hit
+    unique_pmids = list(dict.fromkeys(p.strip() for p in pmids if p and p.strip()))
+    logger.info(f"Starting batch analysis for {len(unique_pmids)} PMIDs")
+
+    metadata_by_pmid = await pubmed_retriever.get_paper_metadata_batch_async(unique_pmids)
+
+    if USE_FULLTEXT:
+        # Each fetch only sleeps its own thread for rate limiting, so cap how many hit NCBI at once
+        ncbi_sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_fulltext(pmid: str) -> str:
+            async with ncbi_sem:
+                return await pubmed_retriever.get_pmc_fulltext_async(pmid)
+
+        full_texts = await asyncio.gather(
+            *(fetch_fulltext(pmid) for pmid in unique_pmids),
+            return_exceptions=True
+        )
+    else:
+        full_texts = [""] * len(unique_pmids)
+
+    async def analyze_one(pmid: str, full_text) -> Optional[Dict]:
+        try:
+            metadata = metadata_by_pmid.get(pmid, {})
+            if "error" in metadata:
+                logger.warning(f"Metadata fetch error for PMID {pmid}: {metadata['error']}")
+            texts = {
+                "title": metadata.get("title", ""),
+                "abstract": metadata.get("abstract", ""),
+                "authors": metadata.get("authors", []),
+                "journal": metadata.get("journal", ""),
+                "publication_date": metadata.get("publication_date", ""),
+                "full_text": full_text if isinstance(full_text, str) else "",
+            }
+            return await analyze_texts(pmid, texts)
+        except Exception as e:
+            logger.error(f"Error in batch analysis for PMID {pmid}: {e}")
+            return None
+
+    results = await asyncio.gather(
+        *(analyze_one(pmid, full_text) for pmid, full_text in zip(unique_pmids, full_texts))
+    )
+    return dict(zip(unique_pmids, results))
+
+
+async def analyze_texts(pmid: str, texts: Dict) -> Optional[Dict]:
+    """
+    Run the 6-field analysis on already retrieved paper texts.
+    """
+    try:
         if not texts.get('title') and not texts.get('abstract'):
             logger.warning(f"No content found for PMID: {pmid}")
             return None
@@ -55,15 +123,20 @@ async def analyze_paper_simple(pmid: str) -> Optional[Dict]:
             logger.warning(f"No analyzable text found for PMID: {pmid}")
             return None
         
-        # Analyze each of the 6 essential fields
-        field_results = {}
-        for field_name, question in ESSENTIAL_FIELDS.items():
-            try:
-                field_result = await analyze_single_field(analysis_text, field_name, question, pmid)
-                field_results[field_name] = field_result
-            except Exception as e:
-                logger.error(f"Error analyzing field {field_name} for PMID {pmid}: {e}")
-                field_results[field_name] = create_empty_field_result(field_name)
+        # One request for all 6 fields (shared with concurrent papers); per-field requests only if that answer is unusable
+        field_results = await _fields_batcher.submit((pmid, analysis_text))
+        if field_results is None:
+            outcomes = await asyncio.gather(
+                *(analyze_single_field(analysis_text, field_name, question, pmid)
+                  for field_name, question in ESSENTIAL_FIELDS.items()),
+                return_exceptions=True
+            )
+            field_results = {}
+            for field_name, outcome in zip(ESSENTIAL_FIELDS, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Error analyzing field {field_name} for PMID {pmid}: {outcome}")
+                    outcome = create_empty_field_result(field_name)
+                field_results[field_name] = outcome
         
         # Create final result
         result = {
@@ -81,10 +154,146 @@ async def analyze_paper_simple(pmid: str) -> Optional[Dict]:
         return result
         
     except Exception as e:
-        logger.error(f"Error in simple analysis for PMID {pmid}: {e}")
+        logger.error(f"Error analyzing texts for PMID {pmid}: {e}")
         return None
 
 
+_ALL_FIELDS_QUESTIONS = "\n".join(f'        - "{name}": {question}' for name, question in ESSENTIAL_FIELDS.items())
+_ALL_FIELDS_SCHEMA = ",\n".join(
+    f'            "{name}": {{"value": "...", "status": "PRESENT|PARTIALLY_PRESENT|ABSENT", '
+    f'"confidence": 0.0-1.0, "reason_if_missing": "..."}}'
+    for name in ESSENTIAL_FIELDS
+)
+# Room for six field objects; the default chat limit is sized for a single short answer
+_ALL_FIELDS_MAX_TOKENS = 1024
+
+
+async def analyze_all_fields(text: str, pmid: str) -> Optional[Dict[str, Dict]]:
+    """
+    Analyze all 6 essential fields with a single LLM call.
+
+    Returns None if the call fails or the reply holds no JSON object, so the caller
+    can fall back to per-field analysis. Fields missing from the reply are marked empty.
+    """
+    try:
+        prompt = f"""
+        Context: {text[:2000]}
+        
+        Answer each of these questions based on the context, keyed by field name:
+{_ALL_FIELDS_QUESTIONS}
+        
+        Give specific answers. If the information is not available, use null as the value and status ABSENT.
+        
+        Respond with a single JSON object in this format:
+        {{
+{_ALL_FIELDS_SCHEMA}
+        }}
+        """
+        
+        async with _field_sem:
+            response = await asyncio.wait_for(
+                unified_qa.chat(prompt, max_output_tokens=_ALL_FIELDS_MAX_TOKENS, use_cache=True,
+                                timeout=ANALYSIS_TIMEOUT * 2),
+                timeout=ANALYSIS_TIMEOUT * 2
+            )
+        
+        parsed = parse_llm_json(response.get('text', ''))
+        if parsed is None:
+            logger.warning(f"No JSON in combined field analysis for PMID {pmid}")
+            return None
+        return _fields_from_json(parsed, response.get('confidence', 0.0))
+        
+    except asyncio.TimeoutError:
+        logger.warning(f"Combined field analysis timed out for PMID {pmid}")
+        return None
+    except Exception as e:
+        logger.warning(f"Combined field analysis failed for PMID {pmid}: {e}")
+        return None
+
+
+async def _analyze_fields_batch(items: List[Tuple[str, str]]) -> List[Optional[Dict[str, Dict]]]:
+    """
+    Analyze all 6 fields for several papers with one LLM call, keyed by PMID.
+
+    Papers missing from the reply, or the whole batch if the call fails, are
+    retried individually through analyze_all_fields.
+    """
+    if len(items) == 1:
+        pmid, text = items[0]
+        return [await analyze_all_fields(text, pmid)]
+
+    results: List[Optional[Dict[str, Dict]]] = [None] * len(items)
+    try:
+        papers = "\n\n".join(f"=== PMID {pmid} ===\n{text[:2000]}" for pmid, text in items)
+        prompt = f"""
+        Context for {len(items)} papers:
+{papers}
+        
+        For each paper, answer each of these questions based on that paper's context, keyed by field name:
+{_ALL_FIELDS_QUESTIONS}
+        
+        Give specific answers. If the information is not available, use null as the value and status ABSENT.
+        
+        Respond with a single JSON object with one key per PMID, each holding an object in this format:
+        {{
+{_ALL_FIELDS_SCHEMA}
+        }}
+        """
+        
+        async with _field_sem:
+            response = await asyncio.wait_for(
+                unified_qa.chat(prompt, max_output_tokens=_ALL_FIELDS_MAX_TOKENS * len(items), use_cache=True,
+                                timeout=ANALYSIS_TIMEOUT * 2 * len(items)),
+                # Output budget grows with the batch, so the deadline must too
+                timeout=ANALYSIS_TIMEOUT * 2 * len(items)
+            )
+        
+        parsed = parse_llm_json(response.get('text', ''))
+        if parsed is not None:
+            confidence = response.get('confidence', 0.0)
+            for i, (pmid, _) in enumerate(items):
+                paper_json = parsed.get(pmid)
+                if isinstance(paper_json, dict):
+                    results[i] = _fields_from_json(paper_json, confidence)
+    except asyncio.TimeoutError:
+        logger.warning(f"Batched field analysis timed out for {len(items)} papers")
+    except Exception as e:
+        logger.warning(f"Batched field analysis failed for {len(items)} papers: {e}")
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        logger.info(f"Analyzing {len(missing)} of {len(items)} batched papers individually")
+        singles = await asyncio.gather(*(analyze_all_fields(items[i][1], items[i][0]) for i in missing))
+        for i, result in zip(missing, singles):
+            results[i] = result
+    return results
+
+
+# Concurrent analyze_texts calls within FIELD_BATCH_WAIT share one multi-paper request
+_fields_batcher = AsyncBatcher(_analyze_fields_batch, max_batch_size=FIELD_BATCH_SIZE, max_wait=FIELD_BATCH_WAIT)
+
+
+def _fields_from_json(parsed: Dict, default_confidence: float) -> Dict[str, Dict]:
+    """Build field results for all 6 fields from one paper's JSON answer."""
+    field_results = {}
+    for field_name in ESSENTIAL_FIELDS:
+        try:
+            field_results[field_name] = _field_result(parsed[field_name], default_confidence)
+        except (KeyError, AttributeError, TypeError, ValueError):
+            field_results[field_name] = create_empty_field_result(field_name)
+    return field_results
+
+
+def _field_result(field_data: Dict, default_confidence: float) -> Dict:
+    """Normalize one field's JSON answer into the field result shape."""
+    return {
+        "value": field_data.get("value"),
+        "status": field_data.get("status", "ABSENT"),
+        "confidence": float(field_data.get("confidence", default_confidence)),
+        "reason_if_missing": field_data.get("reason_if_missing", "")
+    }
+
+
 async def analyze_single_field(text: str, field_name: str, question: str, pmid: str) -> Dict:
     """
     Analyze a single field using the LLM.
@@ -106,31 +315,20 @@ async def analyze_single_field(text: str, field_name: str, question: str, pmid:
         }}
         """
         
-        response = await asyncio.wait_for(
-            unified_qa.chat(prompt),
-            timeout=ANALYSIS_TIMEOUT
-        )
+        async with _field_sem:
+            response = await asyncio.wait_for(
+                unified_qa.chat(prompt, use_cache=True, timeout=ANALYSIS_TIMEOUT),
+                timeout=ANALYSIS_TIMEOUT
+            )
         
         # Parse the response
         answer = response.get('text', '')
         confidence = response.get('confidence', 0.0)
         
         # Try to extract JSON from response
-        try:
-            # Look for JSON in the response
-            json_start = answer.find('{')
-            json_end = answer.rfind('}') + 1
-            if json_start != -1 and json_end > json_start:
-                json_str = answer[json_start:json_end]
-                field_data = json.loads(json_str)
-                return {
-                    "value": field_data.get("value"),
-                    "status": field_data.get("status", "ABSENT"),
-                    "confidence": float(field_data.get("confidence", confidence)),
-                    "reason_if_missing": field_data.get("reason_if_missing", "")
-                }
-        except (json.JSONDecodeError, KeyError):
-            pass
+        field_data = parse_llm_json(answer)
+        if field_data is not None:
+            return _field_result(field_data, confidence)
         
         # Fallback: parse response text
         if not answer or confidence < 0.3:
@@ -7,24 +7,32 @@ metadata extraction and full text retrieval from PubMed Central (PMC).
 """
 
 import requests
+import copy
 import time
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from xml.etree import ElementTree
 
 # Import configuration with fallback values
 try:
-    from app.utils.config import NCBI_RATE_LIMIT_DELAY, API_TIMEOUT, USE_FULLTEXT
+    from app.utils.config import NCBI_RATE_LIMIT_DELAY, API_TIMEOUT, USE_FULLTEXT, MAX_CACHE_SIZE, CACHE_VALIDITY_HOURS
 except ImportError:
     # Fallback configuration if config module is not available
     NCBI_RATE_LIMIT_DELAY = 0.34
     API_TIMEOUT = 30
     USE_FULLTEXT = True
+    MAX_CACHE_SIZE = 1000
+    CACHE_VALIDITY_HOURS = 24
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# NCBI asks for at most ~200 IDs per EFetch request
+_EFETCH_MAX_IDS = 200
+
 class PubMedRetrieverError(Exception):
     """Custom exception for PubMed retrieval errors."""
     pass
@@ -54,8 +62,31 @@ class PubMedRetriever:
         self.api_key = api_key
         self.email = email
         self.session = self._create_session()
+        # Per-PMID LRU caches of (stored_at, value); successful lookups only, expiring after CACHE_VALIDITY_HOURS
+        self._metadata_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._fulltext_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_ttl = CACHE_VALIDITY_HOURS * 3600
         self._verify_connectivity()
     
+    def _cache_get(self, cache: OrderedDict, pmid: str) -> Optional[Any]:
+        with self._cache_lock:
+            entry = cache.get(pmid)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self._cache_ttl:
+                del cache[pmid]
+                return None
+            cache.move_to_end(pmid)
+            return entry[1]
+
+    def _cache_put(self, cache: OrderedDict, pmid: str, value: Any) -> None:
+        with self._cache_lock:
+            cache[pmid] = (time.monotonic(), value)
+            cache.move_to_end(pmid)
+            while len(cache) > MAX_CACHE_SIZE:
+                cache.popitem(last=False)
+
     def _create_session(self) -> requests.Session:
         """Create a configured requests session."""
         session = requests.Session()
@@ -90,7 +121,8 @@ class PubMedRetriever:
                         "The app will continue with limited functionality (e.g., cached data only)."
                     )
 
-    def _make_request(self, endpoint: str, params: Dict[str, Any], retries: int = None) -> Optional[str]:
+    def _make_request(self, endpoint: str, params: Dict[str, Any], retries: int = None,
+                      method: str = "GET") -> Optional[str]:
         """
         Make a request to NCBI E-utilities with retry logic and rate limiting.
         
@@ -98,6 +130,7 @@ class PubMedRetriever:
             endpoint: The E-utilities endpoint to call
             params: Parameters for the request
             retries: Number of retry attempts (defaults to MAX_RETRIES)
+            method: HTTP method; use POST for long ID lists
             
         Returns:
             Response text or None if all retries failed
@@ -111,7 +144,7 @@ class PubMedRetriever:
         for attempt in range(retries):
             try:
                 self._apply_rate_limiting()
-                response = self._execute_request(url, params)
+                response = self._execute_request(url, params, method)
                 response.raise_for_status()
                 return response.text
             except requests.exceptions.RequestException as e:
@@ -136,9 +169,11 @@ class PubMedRetriever:
         delay = max(NCBI_RATE_LIMIT_DELAY, 0.0)
         time.sleep(delay)
     
-    def _execute_request(self, url: str, params: Dict[str, Any]) -> requests.Response:
+    def _execute_request(self, url: str, params: Dict[str, Any], method: str = "GET") -> requests.Response:
         """Execute the HTTP request."""
         timeout = min(API_TIMEOUT or 30, 8)
+        if method == "POST":
+            return self.session.post(url, data=params, timeout=(5, timeout))
         return self.session.get(url, params=params, timeout=(5, timeout))
     
     def _handle_request_error(self, error: requests.exceptions.RequestException, 
@@ -171,7 +206,39 @@ class PubMedRetriever:
         """Helper to check if a field is non-empty and valid."""
         return bool(field and str(field).strip())
 
-    def fetch_paper_metadata(self, pmid: str) -> Dict[str, Any]:
+    def _parse_article(self, article: ElementTree.Element, pmid: str) -> Dict[str, Any]:
+        """Extract metadata fields from a MedlineCitation/Article node."""
+        title = article.findtext("ArticleTitle", default="N/A")
+        abstract = " ".join([t.text for t in article.findall(".//AbstractText") if t.text])
+        journal = article.findtext("Journal/Title", default="N/A")
+        authors = [
+            f"{a.findtext('ForeName', default='')} {a.findtext('LastName', default='')}".strip()
+            for a in article.findall(".//Author")
+            if a.findtext("LastName") is not None
+        ]
+
+        metadata = {
+            "pmid": pmid,
+            "title": title,
+            "abstract": abstract,
+            "journal": journal,
+            "authors": authors,
+        }
+
+        pub_date = article.findtext("Journal/JournalIssue/PubDate/Year") \
+                   or article.findtext("ArticleDate/Year")
+        if pub_date:
+            metadata["publication_date"] = pub_date
+
+        return metadata
+
+    def fetch_paper_metadata(self, pmid: str, use_cache: bool = True) -> Dict[str, Any]:
+        """Fetch metadata for one PMID; use_cache=False always queries NCBI (e.g. for health checks)."""
+        if use_cache:
+            cached = self._cache_get(self._metadata_cache, pmid)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
         xml_data = self._make_request("efetch.fcgi", {"db": "pubmed", "id": pmid, "retmode": "xml"})
 
         if not xml_data:
@@ -185,29 +252,9 @@ class PubMedRetriever:
                 logger.warning(f"⚠️ No article node found for PMID {pmid}.")
                 return {"error": "No article metadata found."}
 
-            title = article.findtext("ArticleTitle", default="N/A")
-            abstract = " ".join([t.text for t in article.findall(".//AbstractText") if t.text])
-            journal = article.findtext("Journal/Title", default="N/A")
-            authors = [
-                f"{a.findtext('ForeName', default='')} {a.findtext('LastName', default='')}".strip()
-                for a in article.findall(".//Author")
-                if a.findtext("LastName") is not None
-            ]
-
-            metadata = {
-                "pmid": pmid,
-                "title": title,
-                "abstract": abstract,
-                "journal": journal,
-                "authors": authors,
-            }
-
-            pub_date = article.findtext("Journal/JournalIssue/PubDate/Year") \
-                       or article.findtext("ArticleDate/Year")
-            if pub_date:
-                metadata["publication_date"] = pub_date
-
-            return metadata
+            metadata = self._parse_article(article, pmid)
+            self._cache_put(self._metadata_cache, pmid, metadata)
+            return copy.deepcopy(metadata)
 
         except ElementTree.ParseError as e:
             logger.error(f"XML parsing error for PMID {pmid}: {e}")
@@ -238,6 +285,75 @@ class PubMedRetriever:
             logger.error(f"Error parsing fallback esummary for PMID {pmid}: {e}")
             return {"error": "Fallback retrieval failed."}
 
+    def fetch_paper_metadata_batch(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve metadata for several PMIDs with as few EFetch requests as possible.
+
+        Previously fetched PMIDs are served from an in-memory TTL/LRU cache; the
+        remaining IDs are POSTed in chunks of up to _EFETCH_MAX_IDS.
+
+        Args:
+            pmids: PubMed IDs to retrieve (duplicates are ignored)
+
+        Returns:
+            Mapping of PMID to metadata dict (``{"error": ...}`` for misses)
+        """
+        unique_pmids = list(dict.fromkeys(p.strip() for p in pmids if p and p.strip()))
+        results: Dict[str, Dict[str, Any]] = {}
+        to_fetch: List[str] = []
+
+        for pmid in unique_pmids:
+            cached = self._cache_get(self._metadata_cache, pmid)
+            if cached is not None:
+                results[pmid] = copy.deepcopy(cached)
+            else:
+                to_fetch.append(pmid)
+
+        if not to_fetch:
+            return results
+
+        fetched: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(to_fetch), _EFETCH_MAX_IDS):
+            chunk = to_fetch[start:start + _EFETCH_MAX_IDS]
+            xml_data = self._make_request(
+                "efetch.fcgi",
+                {"db": "pubmed", "id": ",".join(chunk), "retmode": "xml"},
+                method="POST",
+            )
+            if not xml_data:
+                logger.error(f"❌ No data returned from PubMed for batch of {len(chunk)} PMIDs.")
+                for pmid in chunk:
+                    results[pmid] = {"error": "PubMed unreachable or invalid response."}
+                continue
+
+            try:
+                root = ElementTree.fromstring(xml_data)
+                for pubmed_article in root.iterfind("PubmedArticle"):
+                    pmid = pubmed_article.findtext("MedlineCitation/PMID")
+                    article = pubmed_article.find("MedlineCitation/Article")
+                    if pmid and article is not None:
+                        fetched[pmid] = self._parse_article(article, pmid)
+            except ElementTree.ParseError as e:
+                logger.error(f"XML parsing error for PMID batch {chunk}: {e}")
+
+        for pmid, metadata in fetched.items():
+            self._cache_put(self._metadata_cache, pmid, metadata)
+
+        for pmid in to_fetch:
+            if pmid in results:
+                continue
+            if pmid in fetched:
+                results[pmid] = copy.deepcopy(fetched[pmid])
+            else:
+                logger.warning(f"⚠️ No article node found for PMID {pmid}.")
+                results[pmid] = {"error": "No article metadata found."}
+
+        return results
+
+    async def get_paper_metadata_batch_async(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Async wrapper for batch metadata retrieval."""
+        return await asyncio.to_thread(self.fetch_paper_metadata_batch, pmids)
+
     def search(self, query: str, max_results: int = 10) -> List[str]:
         xml_data = self._make_request("esearch.fcgi", {
             "db": "pubmed", "term": query, "retmax": max_results, "retmode": "xml"
@@ -252,14 +368,18 @@ class PubMedRetriever:
             logger.error(f"Error parsing search results: {e}")
             return []
 
-    async def get_paper_metadata_async(self, pmid: str) -> Dict[str, Any]:
-        return await asyncio.to_thread(self.fetch_paper_metadata, pmid)
+    async def get_paper_metadata_async(self, pmid: str, use_cache: bool = True) -> Dict[str, Any]:
+        return await asyncio.to_thread(self.fetch_paper_metadata, pmid, use_cache)
 
     def get_pmc_fulltext(self, pmid: str) -> str:
         """
         Retrieve full text from PubMed Central (PMC) if available.
         This method attempts to find the PMC ID and retrieve the full text.
         """
+        cached = self._cache_get(self._fulltext_cache, pmid)
+        if cached is not None:
+            return cached
+
         try:
             # First, try to get PMC ID from PubMed
             pmc_id = self._get_pmc_id_from_pmid(pmid)
@@ -268,7 +388,10 @@ class PubMedRetriever:
                 return ""
             
             # Retrieve full text from PMC
-            return self._get_pmc_fulltext_by_id(pmc_id)
+            full_text = self._get_pmc_fulltext_by_id(pmc_id)
+            if full_text:
+                self._cache_put(self._fulltext_cache, pmid, full_text)
+            return full_text
             
         except Exception as e:
             logger.warning(f"Error retrieving full text for PMID {pmid}: {e}")
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Async circuit breaker for calls to an external service.
+
+    After `fail_threshold` consecutive failures the circuit opens and calls are
+    rejected with CircuitOpenError for `reset_timeout` seconds. The first call
+    after that is let through as a probe (half-open): success closes the
+    circuit, failure re-opens it.
+
+    Usage:
+        async with breaker:
+            await call()
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, name: str, fail_threshold: int = 5, reset_timeout: float = 30.0,
+                 is_failure: Optional[Callable[[BaseException], bool]] = None):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure or (lambda exc: True)
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._probe_in_flight = False
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self):
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed")
+        self.state = self.CLOSED
+        self.fail_count = 0
+        self._probe_in_flight = False
+
+    def record_failure(self):
+        self.fail_count += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.fail_count >= self.fail_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit '{self.name}' opened after {self.fail_count} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    async def __aenter__(self):
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit '{self.name}' is open")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc is None:
+            self.record_success()
+        elif isinstance(exc, asyncio.CancelledError):
+            # Caller went away; the outcome tells us nothing about the service
+            self._probe_in_flight = False
+        elif self.is_failure(exc):
+            self.record_failure()
+        else:
+            # The service answered (e.g. a bad request), so it is reachable
+            self.record_success()
+        return False
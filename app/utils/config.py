@@ -32,6 +32,11 @@ EMAIL = os.getenv('EMAIL', '')
 # Model Configuration
 DEFAULT_MODEL = os.getenv('DEFAULT_MODEL', 'gemini')
 AVAILABLE_MODELS = []
+# Gemini client transport ("grpc", "grpc_asyncio" or "rest"); empty uses the SDK default
+GEMINI_TRANSPORT = os.getenv('GEMINI_TRANSPORT') or None
+# Skip the model call for papers whose title/abstract mention no microbiome terms at all
+FAST_PREFILTER = os.getenv('FAST_PREFILTER', '0').lower() in ('1', 'true', 'yes')
+DEBUG_LIST_MODELS = os.getenv('DEBUG_LIST_MODELS', '0').lower() in ('1', 'true', 'yes')
 
 # Initialize available models
 if GEMINI_API_KEY:
@@ -97,13 +102,31 @@ ANALYSIS_TIMEOUT = int(os.getenv("ANALYSIS_TIMEOUT", "45"))  # seconds - total a
 GEMINI_TIMEOUT = int(os.getenv("GEMINI_TIMEOUT", "30"))  # seconds - Gemini API timeout
 FRONTEND_TIMEOUT = int(os.getenv("FRONTEND_TIMEOUT", "60"))  # seconds - frontend timeout
 
+# Prompt size - full text beyond this many tokens is cut before it is sent to the model
+MAX_FULL_TEXT_TOKENS = int(os.getenv("MAX_FULL_TEXT_TOKENS", "8000"))
+
 # Cache Configuration
 CACHE_VALIDITY_HOURS = int(os.getenv("CACHE_VALIDITY_HOURS", "24"))
 MAX_CACHE_SIZE = int(os.getenv("MAX_CACHE_SIZE", "1000"))  # number of entries
+GEMINI_HEALTH_CACHE_TTL = int(os.getenv("GEMINI_HEALTH_CACHE_TTL", "30"))  # seconds
 
 # Rate Limiting
 NCBI_RATE_LIMIT_DELAY = float(os.getenv("NCBI_RATE_LIMIT_DELAY", "0.34"))  # seconds
 MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "3"))
+MAX_BATCH_PMIDS = int(os.getenv("MAX_BATCH_PMIDS", "100"))  # PMIDs accepted per /api/v1/analyze/batch request
+GEMINI_BREAKER_THRESHOLD = int(os.getenv("GEMINI_BREAKER_THRESHOLD", "5"))  # consecutive failures before failing fast
+GEMINI_BREAKER_RESET = float(os.getenv("GEMINI_BREAKER_RESET", "30"))  # seconds before a probe call is allowed
+GEMINI_RETRY_ATTEMPTS = max(1, int(os.getenv("GEMINI_RETRY_ATTEMPTS", "2")))  # total attempts on timeout/unavailable
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "32"))  # in-flight Gemini calls per GeminiQA instance (each UnifiedQA builds one)
+GEMINI_ACQUIRE_TIMEOUT = float(os.getenv("GEMINI_ACQUIRE_TIMEOUT", "10"))  # seconds to wait for a free Gemini slot
+FIELD_BATCH_SIZE = int(os.getenv("FIELD_BATCH_SIZE", "4"))  # concurrent papers per BugSigDB field request; 1 disables
+FIELD_BATCH_WAIT = float(os.getenv("FIELD_BATCH_WAIT", "0.05"))  # seconds to wait for more papers to join a batch
+GEMINI_RPS = float(os.getenv("GEMINI_RPS", "0"))  # Gemini requests per second per process; 0 disables pacing
+GEMINI_BURST = int(os.getenv("GEMINI_BURST", "10"))  # requests allowed back-to-back before pacing applies
+
+# CORS configuration - comma-separated origins ("*" allows any origin without credentials)
+ALLOWED_ORIGINS = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "*").split(",") if o.strip()]
+ALLOWED_ORIGIN_REGEX = os.getenv("ALLOWED_ORIGIN_REGEX") or None
 
 # Retrieval configuration
 USE_FULLTEXT = os.getenv('USE_FULLTEXT', '0').lower() in ('1', 'true', 'yes')
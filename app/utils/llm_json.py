@@ -0,0 +1,100 @@
+import json
+import re
+from typing import Dict, Optional
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|$)", re.DOTALL | re.IGNORECASE)
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _load_object(text: str) -> Optional[Dict]:
+    try:
+        value = json.loads(text)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """Drop commas that directly precede } or ], leaving string contents untouched."""
+    chars = []
+    in_string = escaped = False
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ",":
+            j = i + 1
+            while j < len(text) and text[j].isspace():
+                j += 1
+            if j < len(text) and text[j] in "}]":
+                continue
+        chars.append(char)
+    return "".join(chars)
+
+
+def _load_object_lenient(text: str) -> Optional[Dict]:
+    """_load_object, retrying with trailing commas before } or ] removed."""
+    result = _load_object(text)
+    if result is None:
+        repaired = _strip_trailing_commas(text)
+        if repaired != text:
+            result = _load_object(repaired)
+    return result
+
+
+def parse_llm_json(answer: str) -> Optional[Dict]:
+    """
+    Recover the first JSON object from an LLM reply, or None.
+
+    Tries, in order: the whole reply; the body of a ``` / ```json fence; the
+    first balanced {...} span (string-aware, so braces inside values are
+    ignored); and finally that span with its unclosed strings, arrays and
+    objects closed, for replies cut off at the token limit. The last two
+    steps also tolerate trailing commas before a closing bracket.
+    """
+    if not answer:
+        return None
+    text = answer.strip()
+    result = _load_object(text)
+    if result is not None:
+        return result
+
+    fence = _FENCE_RE.search(text)
+    if fence:
+        text = fence.group(1).strip()
+        result = _load_object(text)
+        if result is not None:
+            return result
+
+    start = text.find("{")
+    if start == -1:
+        return None
+    closers = []
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            closers.append(_CLOSERS[char])
+        elif closers and char == closers[-1]:
+            closers.pop()
+            if not closers:
+                return _load_object_lenient(text[start:i + 1])
+
+    # Truncated reply: close whatever is still open
+    tail = text[start:] + ('"' if in_string else "")
+    return _load_object_lenient(tail.rstrip().rstrip(",") + "".join(reversed(closers)))
@@ -0,0 +1,17 @@
+"""Tests for API request model validation."""
+import pytest
+from pydantic import ValidationError
+
+from app.api.models.api_models import BatchAnalysisRequest
+from app.utils.config import MAX_BATCH_PMIDS
+
+
+def test_batch_request_accepts_up_to_the_limit():
+    pmids = [str(n) for n in range(MAX_BATCH_PMIDS)]
+
+    assert BatchAnalysisRequest(pmids=pmids).pmids == pmids
+
+
+def test_batch_request_rejects_oversized_lists():
+    with pytest.raises(ValidationError):
+        BatchAnalysisRequest(pmids=[str(n) for n in range(MAX_BATCH_PMIDS + 1)])
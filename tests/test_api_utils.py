@@ -0,0 +1,81 @@
+"""Tests for the PMID-indexed CSV metadata lookup."""
+import pytest
+
+from app.api.utils import api_utils
+from app.api.utils.api_utils import get_paper_metadata_from_csv
+
+
+@pytest.fixture(autouse=True)
+def clear_csv_index():
+    api_utils._CSV_INDEX.clear()
+    yield
+    api_utils._CSV_INDEX.clear()
+
+
+def _write_csv(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_lookup_by_pmid(tmp_path):
+    csv_path = _write_csv(tmp_path / "dump.csv",
+                          "pmid,title,authors,journal,publication_date,extra\n"
+                          "111,Gut study,Smith J,Microbiome,2021,x\n"
+                          "222,\"Oral, skin study\",Doe A,Cell,2019,y\n")
+
+    assert get_paper_metadata_from_csv("222", csv_path) == {
+        "title": "Oral, skin study",
+        "authors": "Doe A",
+        "journal": "Cell",
+        "publication_date": "2019",
+    }
+
+
+def test_unknown_pmid_returns_none(tmp_path):
+    csv_path = _write_csv(tmp_path / "dump.csv", "pmid,title\n111,Gut study\n")
+
+    assert get_paper_metadata_from_csv("999", csv_path) is None
+
+
+def test_missing_columns_and_short_rows_default_to_empty(tmp_path):
+    csv_path = _write_csv(tmp_path / "dump.csv", "title,pmid,journal\nGut study,111\n")
+
+    assert get_paper_metadata_from_csv("111", csv_path) == {
+        "title": "Gut study",
+        "authors": "",
+        "journal": "",
+        "publication_date": "",
+    }
+
+
+def test_first_row_wins_for_duplicate_pmids(tmp_path):
+    csv_path = _write_csv(tmp_path / "dump.csv", "pmid,title\n111,First\n111,Second\n")
+
+    assert get_paper_metadata_from_csv("111", csv_path)["title"] == "First"
+
+
+def test_file_is_indexed_once(tmp_path):
+    path = tmp_path / "dump.csv"
+    csv_path = _write_csv(path, "pmid,title\n111,Original\n")
+    get_paper_metadata_from_csv("111", csv_path)
+
+    path.write_text("pmid,title\n111,Rewritten\n", encoding="utf-8")
+
+    assert get_paper_metadata_from_csv("111", csv_path)["title"] == "Original"
+
+
+def test_returned_metadata_is_a_copy(tmp_path):
+    csv_path = _write_csv(tmp_path / "dump.csv", "pmid,title\n111,Gut study\n")
+    get_paper_metadata_from_csv("111", csv_path)["title"] = "changed"
+
+    assert get_paper_metadata_from_csv("111", csv_path)["title"] == "Gut study"
+
+
+def test_missing_pmid_column_returns_none(tmp_path):
+    csv_path = _write_csv(tmp_path / "dump.csv", "id,title\n111,Gut study\n")
+
+    assert get_paper_metadata_from_csv("111", csv_path) is None
+
+
+def test_missing_file_returns_none(tmp_path):
+    assert get_paper_metadata_from_csv("111", str(tmp_path / "absent.csv")) is None
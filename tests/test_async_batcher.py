@@ -0,0 +1,94 @@
+"""Tests for request coalescing in AsyncBatcher."""
+import asyncio
+
+import pytest
+
+from app.utils.async_batcher import AsyncBatcher
+
+
+def test_concurrent_submissions_share_one_handler_call():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return [item * 10 for item in items]
+
+    async def scenario():
+        batcher = AsyncBatcher(handler, max_batch_size=10, max_wait=0.01)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+    assert asyncio.run(scenario()) == [0, 10, 20]
+    assert batches == [[0, 1, 2]]
+
+
+def test_full_batch_flushes_without_waiting():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return items
+
+    async def scenario():
+        # A wait far beyond the test timeout: only the size trigger can flush
+        batcher = AsyncBatcher(handler, max_batch_size=2, max_wait=3600)
+        return await asyncio.wait_for(asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1)
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+    assert batches == [["a", "b"]]
+
+
+def test_submissions_beyond_batch_size_start_a_new_batch():
+    batches = []
+
+    async def handler(items):
+        batches.append(list(items))
+        return items
+
+    async def scenario():
+        batcher = AsyncBatcher(handler, max_batch_size=2, max_wait=0.01)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(5)))
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_handler_error_propagates_to_every_submitter():
+    async def handler(items):
+        raise RuntimeError("model down")
+
+    async def scenario():
+        batcher = AsyncBatcher(handler, max_batch_size=10, max_wait=0.01)
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, RuntimeError) and str(r) == "model down" for r in results)
+
+
+def test_wrong_result_count_is_an_error():
+    async def handler(items):
+        return items[:1]
+
+    async def scenario():
+        batcher = AsyncBatcher(handler, max_batch_size=10, max_wait=0.01)
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_failed_batch_does_not_affect_the_next():
+    calls = []
+
+    async def handler(items):
+        calls.append(list(items))
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+        return items
+
+    async def scenario():
+        batcher = AsyncBatcher(handler, max_batch_size=10, max_wait=0.01)
+        with pytest.raises(RuntimeError):
+            await batcher.submit("first")
+        return await batcher.submit("second")
+
+    assert asyncio.run(scenario()) == "second"
@@ -0,0 +1,123 @@
+"""Tests for the async circuit breaker state machine."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils import circuit_breaker as cb_module
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cb_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+async def _fail(breaker, exc=RuntimeError("boom")):
+    with pytest.raises(type(exc)):
+        async with breaker:
+            raise exc
+
+
+async def _succeed(breaker):
+    async with breaker:
+        return "ok"
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    breaker = CircuitBreaker("test", fail_threshold=3, reset_timeout=30)
+
+    async def scenario():
+        for _ in range(2):
+            await _fail(breaker)
+        assert breaker.state == CircuitBreaker.CLOSED
+        await _fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            await _succeed(breaker)
+
+    asyncio.run(scenario())
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker("test", fail_threshold=2, reset_timeout=30)
+
+    async def scenario():
+        await _fail(breaker)
+        await _succeed(breaker)
+        await _fail(breaker)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = CircuitBreaker("test", fail_threshold=1, reset_timeout=30)
+
+    async def scenario():
+        await _fail(breaker)
+        clock.now += 30
+        assert await _succeed(breaker) == "ok"
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.fail_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_half_open_allows_a_single_probe(clock):
+    breaker = CircuitBreaker("test", fail_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+
+    assert breaker.allow() is True
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow() is False
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = CircuitBreaker("test", fail_threshold=1, reset_timeout=30)
+
+    async def scenario():
+        await _fail(breaker)
+        clock.now += 30
+        await _fail(breaker)
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now += 29
+        with pytest.raises(CircuitOpenError):
+            await _succeed(breaker)
+
+    asyncio.run(scenario())
+
+
+def test_non_failure_exceptions_count_as_success(clock):
+    breaker = CircuitBreaker("test", fail_threshold=1, reset_timeout=30,
+                             is_failure=lambda exc: not isinstance(exc, ValueError))
+
+    async def scenario():
+        await _fail(breaker, ValueError("bad request"))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_frees_half_open_slot(clock):
+    breaker = CircuitBreaker("test", fail_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+
+    async def scenario():
+        await _fail(breaker, asyncio.CancelledError())
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow() is True
+
+    asyncio.run(scenario())
@@ -0,0 +1,173 @@
+"""Tests for PubMed metadata parsing and the per-PMID metadata cache."""
+from xml.etree import ElementTree
+
+import pytest
+
+from app.services.data_retrieval import PubMedRetriever
+
+EFETCH_XML = """<?xml version="1.0" ?>
+<PubmedArticleSet>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>111</PMID>
+      <Article>
+        <Journal>
+          <JournalIssue><PubDate><Year>2021</Year></PubDate></JournalIssue>
+          <Title>Microbiome Journal</Title>
+        </Journal>
+        <ArticleTitle>Gut microbiota in IBD</ArticleTitle>
+        <Abstract>
+          <AbstractText>Background text.</AbstractText>
+          <AbstractText>Results text.</AbstractText>
+        </Abstract>
+        <AuthorList>
+          <Author><LastName>Smith</LastName><ForeName>Jane</ForeName></Author>
+          <Author><CollectiveName>Consortium</CollectiveName></Author>
+        </AuthorList>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+  <PubmedArticle>
+    <MedlineCitation>
+      <PMID>222</PMID>
+      <Article>
+        <Journal><Title>Other Journal</Title></Journal>
+        <ArticleTitle>Oral bacteria</ArticleTitle>
+        <ArticleDate><Year>2019</Year></ArticleDate>
+      </Article>
+    </MedlineCitation>
+  </PubmedArticle>
+</PubmedArticleSet>
+"""
+
+
+@pytest.fixture
+def retriever(monkeypatch):
+    monkeypatch.setattr(PubMedRetriever, "_verify_connectivity", lambda self, retries=3: None)
+    retriever = PubMedRetriever()
+    retriever.requests = []
+
+    def fake_request(endpoint, params, retries=None, method="GET"):
+        retriever.requests.append((endpoint, params["id"]))
+        return EFETCH_XML
+
+    monkeypatch.setattr(retriever, "_make_request", fake_request)
+    return retriever
+
+
+def test_parse_article_extracts_fields(retriever):
+    root = ElementTree.fromstring(EFETCH_XML)
+    article = root.find("PubmedArticle/MedlineCitation/Article")
+
+    metadata = retriever._parse_article(article, "111")
+
+    assert metadata == {
+        "pmid": "111",
+        "title": "Gut microbiota in IBD",
+        "abstract": "Background text. Results text.",
+        "journal": "Microbiome Journal",
+        "authors": ["Jane Smith"],
+        "publication_date": "2021",
+    }
+
+
+def test_parse_article_falls_back_to_article_date(retriever):
+    root = ElementTree.fromstring(EFETCH_XML)
+    article = root.findall("PubmedArticle/MedlineCitation/Article")[1]
+
+    metadata = retriever._parse_article(article, "222")
+
+    assert metadata["publication_date"] == "2019"
+    assert metadata["abstract"] == ""
+    assert metadata["authors"] == []
+
+
+def test_batch_fetch_maps_results_by_pmid(retriever):
+    results = retriever.fetch_paper_metadata_batch(["111", " 222 ", "111", "333", ""])
+
+    assert set(results) == {"111", "222", "333"}
+    assert results["111"]["title"] == "Gut microbiota in IBD"
+    assert results["222"]["title"] == "Oral bacteria"
+    assert "error" in results["333"]
+    assert retriever.requests == [("efetch.fcgi", "111,222,333")]
+
+
+def test_batch_fetch_splits_large_requests(retriever):
+    pmids = [str(n) for n in range(1000, 1450)]
+
+    retriever.fetch_paper_metadata_batch(pmids)
+
+    assert [len(ids.split(",")) for _, ids in retriever.requests] == [200, 200, 50]
+
+
+def test_batch_fetch_reports_failed_chunk_only(retriever, monkeypatch):
+    pmids = ["111"] + [str(n) for n in range(1000, 1200)]
+
+    def fake_request(endpoint, params, retries=None, method="GET"):
+        return EFETCH_XML if params["id"].startswith("111") else None
+
+    monkeypatch.setattr(retriever, "_make_request", fake_request)
+    results = retriever.fetch_paper_metadata_batch(pmids)
+
+    assert results["111"]["title"] == "Gut microbiota in IBD"
+    assert results["1199"] == {"error": "PubMed unreachable or invalid response."}
+
+
+def test_batch_fetch_serves_cached_pmids(retriever):
+    retriever.fetch_paper_metadata_batch(["111", "222"])
+    retriever.requests.clear()
+
+    results = retriever.fetch_paper_metadata_batch(["111", "222"])
+
+    assert results["111"]["title"] == "Gut microbiota in IBD"
+    assert retriever.requests == []
+
+
+def test_batch_fetch_does_not_cache_misses(retriever):
+    retriever.fetch_paper_metadata_batch(["333"])
+    retriever.requests.clear()
+
+    retriever.fetch_paper_metadata_batch(["333"])
+
+    assert retriever.requests == [("efetch.fcgi", "333")]
+
+
+def test_cached_results_are_copies(retriever):
+    retriever.fetch_paper_metadata_batch(["111"])["111"]["title"] = "changed"
+
+    assert retriever.fetch_paper_metadata_batch(["111"])["111"]["title"] == "Gut microbiota in IBD"
+
+
+def test_mutating_returned_authors_leaves_cache_intact(retriever):
+    retriever.fetch_paper_metadata_batch(["111"])["111"]["authors"].append("Intruder")
+    retriever.fetch_paper_metadata_batch(["111"])["111"]["authors"].clear()
+    retriever.fetch_paper_metadata("111")["authors"].append("Intruder")
+
+    assert retriever.fetch_paper_metadata("111")["authors"] == ["Jane Smith"]
+
+
+def test_single_fetch_shares_cache_with_batch(retriever):
+    retriever.fetch_paper_metadata_batch(["111"])
+    retriever.requests.clear()
+
+    assert retriever.fetch_paper_metadata("111")["title"] == "Gut microbiota in IBD"
+    assert retriever.requests == []
+
+
+def test_single_fetch_can_bypass_cache(retriever):
+    retriever.fetch_paper_metadata_batch(["111"])
+    retriever.requests.clear()
+
+    retriever.fetch_paper_metadata("111", use_cache=False)
+
+    assert retriever.requests == [("efetch.fcgi", "111")]
+
+
+def test_expired_entries_are_refetched(retriever):
+    retriever.fetch_paper_metadata("111")
+    retriever._cache_ttl = -1
+    retriever.requests.clear()
+
+    retriever.fetch_paper_metadata("111")
+
+    assert retriever.requests == [("efetch.fcgi", "111")]
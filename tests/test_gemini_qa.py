@@ -0,0 +1,84 @@
+"""Tests for deadlines and retries around Gemini chat calls."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.models import gemini_qa as gq_module
+from app.models.gemini_qa import GeminiQA
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel; every call takes `delay` seconds."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+        self.configs = []
+
+    async def generate_content_async(self, *args, **kwargs):
+        self.calls += 1
+        self.configs.append(kwargs.get("generation_config"))
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(text="reply", candidates=[])
+
+
+@pytest.fixture
+def qa(monkeypatch, tmp_path):
+    monkeypatch.setattr(gq_module, "GEMINI_TIMEOUT", 0.05)
+    monkeypatch.setattr(gq_module, "GEMINI_RETRY_ATTEMPTS", 2)
+    monkeypatch.setattr(gq_module, "_RETRY_BACKOFF_BASE", 0)
+    qa = GeminiQA(api_key="test-key", results_dir=tmp_path)
+    qa._bucket = None
+    return qa
+
+
+def test_timed_out_call_is_retried_without_a_deadline(qa):
+    qa._gmodel = FakeModel(delay=1)
+
+    result = asyncio.run(qa.chat("hello"))
+
+    assert result["text"].startswith("[Error: Request timed out")
+    assert qa._gmodel.calls == 2
+
+
+def test_retry_is_skipped_when_it_cannot_finish_before_the_deadline(qa):
+    qa._gmodel = FakeModel(delay=1)
+
+    result = asyncio.run(qa.chat("hello", timeout=0.08))
+
+    assert result["text"].startswith("[Error: Request timed out")
+    assert qa._gmodel.calls == 1
+
+
+def test_retry_runs_when_time_remains_before_the_deadline(qa):
+    qa._gmodel = FakeModel(delay=1)
+
+    asyncio.run(qa.chat("hello", timeout=1))
+
+    assert qa._gmodel.calls == 2
+
+
+def test_long_deadline_is_not_cut_off_at_gemini_timeout(qa):
+    # A slow multi-paper batch: the reply takes longer than GEMINI_TIMEOUT but fits the deadline
+    qa._gmodel = FakeModel(delay=0.15)
+
+    result = asyncio.run(qa.chat("batch", max_output_tokens=4000, timeout=0.5))
+
+    assert result["text"] == "reply"
+    assert qa._gmodel.calls == 1
+
+
+def test_generation_config_is_reused_per_output_budget(qa):
+    qa._gmodel = FakeModel(delay=0)
+
+    async def scenario():
+        await qa.chat("first", max_output_tokens=1200)
+        await qa.chat("second", max_output_tokens=1200)
+        await qa.chat("third", max_output_tokens=2400)
+
+    asyncio.run(scenario())
+    first, second, third = qa._gmodel.configs
+    assert first is second
+    assert third is not first
+    assert third.max_output_tokens == 2400
@@ -0,0 +1,54 @@
+"""Tests for recovering JSON objects from LLM replies."""
+import pytest
+
+from app.utils.llm_json import parse_llm_json
+
+
+def test_plain_object():
+    assert parse_llm_json('{"value": "Human", "confidence": 0.9}') == {"value": "Human", "confidence": 0.9}
+
+
+@pytest.mark.parametrize("reply", [
+    '```json\n{"value": "Human"}\n```',
+    '```\n{"value": "Human"}\n```',
+    'Here is the answer:\n```JSON\n{"value": "Human"}\n```\nLet me know if you need more.',
+])
+def test_fenced_reply(reply):
+    assert parse_llm_json(reply) == {"value": "Human"}
+
+
+@pytest.mark.parametrize("reply, expected", [
+    ('{"value": "Human",}', {"value": "Human"}),
+    ('{"sites": ["gut", "oral",], "n": {"a": 1,},}', {"sites": ["gut", "oral"], "n": {"a": 1}}),
+    ('```json\n{"value": "Human",\n}\n```', {"value": "Human"}),
+])
+def test_trailing_commas(reply, expected):
+    assert parse_llm_json(reply) == expected
+
+
+def test_trailing_comma_inside_string_is_preserved():
+    assert parse_llm_json('{"value": "a,}", "status": "PRESENT",}') == {"value": "a,}", "status": "PRESENT"}
+
+
+def test_object_embedded_in_prose():
+    reply = 'Based on the context, {"value": "Mouse", "note": "uses {braces}"} is my answer. {"ignored": true}'
+    assert parse_llm_json(reply) == {"value": "Mouse", "note": "uses {braces}"}
+
+
+def test_nested_object_embedded_in_prose():
+    reply = 'Result: {"host_species": {"value": "Human", "status": "PRESENT"}} Done.'
+    assert parse_llm_json(reply) == {"host_species": {"value": "Human", "status": "PRESENT"}}
+
+
+@pytest.mark.parametrize("reply, expected", [
+    ('{"value": "Hum', {"value": "Hum"}),
+    ('{"sites": ["gut", "oral",', {"sites": ["gut", "oral"]}),
+    ('{"a": {"b": "c"}, "d": [{"e": 1}', {"a": {"b": "c"}, "d": [{"e": 1}]}),
+])
+def test_truncated_reply_is_closed(reply, expected):
+    assert parse_llm_json(reply) == expected
+
+
+@pytest.mark.parametrize("reply", ["", "No JSON here.", "[1, 2, 3]", '{"value": }'])
+def test_unrecoverable_reply_returns_none(reply):
+    assert parse_llm_json(reply) is None
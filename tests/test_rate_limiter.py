@@ -0,0 +1,83 @@
+"""Tests for the async token-bucket rate limiter."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils import rate_limiter as rl_module
+from app.utils.rate_limiter import AsyncTokenBucket
+
+
+class FakeClock:
+    """Monotonic clock that only advances when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rl_module, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(rl_module, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=clock.sleep))
+    return clock
+
+
+def test_burst_up_to_capacity_does_not_wait(clock):
+    bucket = AsyncTokenBucket(rate=2, capacity=3)
+
+    async def scenario():
+        for _ in range(3):
+            await bucket.acquire()
+
+    asyncio.run(scenario())
+    assert clock.sleeps == []
+
+
+def test_paces_requests_beyond_capacity(clock):
+    bucket = AsyncTokenBucket(rate=4, capacity=2)
+
+    async def scenario():
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+    asyncio.run(scenario())
+    assert clock.sleeps == pytest.approx([0.25, 0.25, 0.25])
+    assert clock.now == pytest.approx(0.75)
+
+
+def test_tokens_refill_over_time(clock):
+    bucket = AsyncTokenBucket(rate=10, capacity=1)
+
+    async def scenario():
+        await bucket.acquire()
+        clock.now += 1.0
+        await bucket.acquire()
+
+    asyncio.run(scenario())
+    assert clock.sleeps == []
+
+
+def test_refill_is_capped_at_capacity(clock):
+    bucket = AsyncTokenBucket(rate=10, capacity=2)
+
+    async def scenario():
+        clock.now += 60
+        for _ in range(3):
+            await bucket.acquire()
+
+    asyncio.run(scenario())
+    assert clock.sleeps == pytest.approx([0.1])
+
+
+@pytest.mark.parametrize("rate, capacity", [(0, 5), (-1, 5), (1, 0.5)])
+def test_rejects_invalid_settings(rate, capacity):
+    with pytest.raises(ValueError):
+        AsyncTokenBucket(rate=rate, capacity=capacity)